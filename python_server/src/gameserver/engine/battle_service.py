@@ -239,32 +239,34 @@ class BattleService:
 
     def _step_shots(self, battle: BattleState, dt_ms: float) -> None:
         """Decrement flight time, apply damage/effects when shots arrive."""
-        shots_to_remove = []
-        
+        landed = False
+
         for shot in battle.pending_shots:
             # Store original flight time for path_progress calculation
             if shot.path_progress == 0.0:
                 # First tick, store total flight time in a way we can access it
                 # We'll use the ratio of flight_remaining_ms to calculate progress
                 shot._total_flight_ms = shot.flight_remaining_ms
-            
+
             # Decrement flight time
             shot.flight_remaining_ms -= dt_ms
-            
+
             # Update path_progress (0.0 at start, 1.0 at arrival)
-            if hasattr(shot, '_total_flight_ms') and shot._total_flight_ms > 0:
+            if shot._total_flight_ms > 0:
                 shot.path_progress = 1.0 - (shot.flight_remaining_ms / shot._total_flight_ms)
                 shot.path_progress = max(0.0, min(1.0, shot.path_progress))
-            
+
             # Check if shot has arrived
             if shot.flight_remaining_ms <= 0:
                 self._apply_shot_damage(battle, shot)
-                shots_to_remove.append(shot)
-        
-        # Remove resolved shots
-        for shot in shots_to_remove:
-            battle.pending_shots.remove(shot)
-    
+                landed = True
+
+        # Remove resolved shots in one pass instead of list.remove per shot
+        if landed:
+            battle.pending_shots = [
+                shot for shot in battle.pending_shots if shot.flight_remaining_ms > 0
+            ]
+
     def _apply_shot_damage(self, battle: BattleState, shot: Shot) -> None:
         """Apply damage and effects from a shot to its target critter."""
         critter = battle.critters.get(shot.target_cid)
@@ -759,12 +761,15 @@ class BattleService:
             return
 
         cu = self._gc.critter_upgrades if self._gc else None
+        from gameserver.network.handlers._core import _svc as _core_svc
 
         for army in battle.armies.values():
+            # Fully spawned armies need neither an empire lookup nor wave steps
+            if all(w.num_critters_spawned >= w.slots for w in army.waves):
+                continue
             uid = army.uid  # owner uid from the Army object (not the dict key)
             attacker_item_upgrades: dict[str, Any] | None = None
             emp = None
-            from gameserver.network.handlers._core import _svc as _core_svc
             try:
                 svc = _core_svc()
                 emp = svc.empire_service.get(uid) if svc.empire_service else None
@@ -776,6 +781,8 @@ class BattleService:
             aura_choice = emp.ruler.aura_choice if emp else ""
 
             for wave in army.waves:
+                if wave.num_critters_spawned >= wave.slots:
+                    continue
                 ruler_cfg: dict[str, Any] | None = self._rulers.get(wave.iid)
                 new_critters = self._step_wave(
                     wave, dt_ms,
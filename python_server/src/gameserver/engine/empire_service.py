@@ -14,21 +14,54 @@ All methods operate on Empire model objects. No network I/O.
 
 from __future__ import annotations
 
+import functools
 import logging
+import math
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from gameserver.engine.upgrade_provider import UpgradeProvider
-    from gameserver.loaders.game_config_loader import GameConfig
+    from gameserver.loaders.game_config_loader import GameConfig, PriceParams
     from gameserver.util.events import EventBus
 
-from gameserver.models.empire import Empire
+from gameserver.models.empire import (
+    INCOME_CULTURE,
+    INCOME_GOLD,
+    INCOME_LIFE,
+    Empire,
+    TickCoefficients,
+)
+from gameserver.models.items import ItemType
 from gameserver.util.eras import ERA_ORDER
+from gameserver.util.events import ItemCompleted
 
 log = logging.getLogger(__name__)
 
 RULER_MAX_LEVEL = 18
 
+# Roles accepted by change_citizens
+_CITIZEN_ROLES = frozenset({"merchant", "scientist", "artist"})
+
+# Purchase counts below this are served from a precomputed price table.
+_PRICE_TABLE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _price_table(u: float, y: float, z: float, v: float) -> tuple[float, ...]:
+    """Precompute ``u + (i*y) * (i+z)^v`` for i in [0, _PRICE_TABLE_SIZE).
+
+    Keyed by the curve parameters, so a game-config reload picks up fresh
+    tables without any explicit invalidation.
+    """
+    return tuple(float(u + (i * y) * (i + z) ** v) for i in range(_PRICE_TABLE_SIZE))
+
+
+def _power_price(p: PriceParams, i: int) -> float:
+    """Evaluate the price formula for the i-th purchase (table lookup for small i)."""
+    if 0 <= i < _PRICE_TABLE_SIZE:
+        return _price_table(p.u, p.y, p.z, p.v)[i]
+    return float(p.u + (i * p.y) * (i + p.z) ** p.v)
+
 
 def ruler_critter_stats(ruler_cfg: "dict[str, Any]", level: int, aura_effects: "dict[str, float] | None" = None) -> "dict[str, Any]":
     """Compute level-scaled critter stats for a ruler.
@@ -72,6 +105,10 @@ class EmpireService:
         self._upgrades = upgrade_provider
         self._events = event_bus
         self._empires: dict[int, Empire] = {}  # uid → Empire
+        # Dense list of the same empires for step_all, plus uid → list slot
+        # so unregister can swap-remove in O(1).
+        self._empires_list: list[Empire] = []
+        self._empires_index: dict[int, int] = {}
 
         # Game balance constants (fall back to defaults if no config)
         from gameserver.loaders.game_config_loader import GameConfig as _GC
@@ -98,6 +135,9 @@ class EmpireService:
         self._world_tile_owner: dict[tuple[int, int], int] | None = None
         self._tile_index_dirty: bool = True
 
+        # Lower-cased empire name -> empire, rebuilt lazily for find_by_name.
+        self._name_index: dict[str, Empire] | None = None
+
     # -- Army ID allocation ----------------------------------------------
 
     def next_army_id(self) -> int:
@@ -123,20 +163,43 @@ class EmpireService:
 
     def register(self, empire: Empire) -> None:
         """Add an empire to the managed set."""
+        empire.rebuild_completed()
+        empire.citizen_total = sum(empire.citizens.values())
+        empire.tick_coefficients = None  # effects may have been restored from state
+        res = empire.resources
+        for key in ("gold", "culture", "life"):
+            res.setdefault(key, 0.0)
         self._empires[empire.uid] = empire
+        slot = self._empires_index.get(empire.uid)
+        if slot is None:
+            self._empires_index[empire.uid] = len(self._empires_list)
+            self._empires_list.append(empire)
+        else:
+            self._empires_list[slot] = empire  # re-register replaces in place
         self.invalidate_tile_index()
+        self.invalidate_name_index()
         log.info("Empire registered: uid=%d name=%r", empire.uid, empire.name)
 
     def unregister(self, uid: int) -> Optional[Empire]:
         """Remove and return an empire from the managed set."""
         self.invalidate_tile_index()
+        self.invalidate_name_index()
+        slot = self._empires_index.pop(uid, None)
+        if slot is not None:
+            last = self._empires_list.pop()
+            if slot < len(self._empires_list):
+                self._empires_list[slot] = last
+                self._empires_index[last.uid] = slot
         return self._empires.pop(uid, None)
 
     def wipe_all_empires(self) -> list[int]:
         """Remove all empires from the in-memory registry. Returns list of removed UIDs."""
         uids = list(self._empires.keys())
         self._empires.clear()
+        self._empires_list.clear()
+        self._empires_index.clear()
         self.invalidate_tile_index()
+        self.invalidate_name_index()
         log.info("All empires wiped (%d total)", len(uids))
         return uids
 
@@ -174,13 +237,23 @@ class EmpireService:
         """Look up an empire by UID."""
         return self._empires.get(uid)
 
+    def invalidate_name_index(self) -> None:
+        """Mark the name index stale (rebuilt on next :meth:`find_by_name`).
+
+        Call after registering/unregistering an empire or renaming one.
+        """
+        self._name_index = None
+
     def find_by_name(self, name: str) -> Optional[Empire]:
         """Look up an empire by name (case-insensitive)."""
-        name_lower = name.lower()
-        for empire in self._empires.values():
-            if empire.name.lower() == name_lower:
-                return empire
-        return None
+        index = self._name_index
+        if index is None:
+            index = {}
+            for empire in self._empires.values():
+                # First registered empire wins on duplicate names, as the scan did
+                index.setdefault(empire.name.lower(), empire)
+            self._name_index = index
+        return index.get(name.lower())
 
     @property
     def all_empires(self) -> dict[int, Empire]:
@@ -201,63 +274,86 @@ class EmpireService:
         """
         if not self._knowledge_era_groups and not self._building_era_groups:
             return self._ERA_ORDER[0]
-        done_knowledge = {iid for iid, remaining in empire.knowledge.items() if remaining == 0.0}
-        done_buildings = {iid for iid, remaining in empire.buildings.items() if remaining == 0.0}
-        current = self._ERA_ORDER[0]
-        for era_key in self._ERA_ORDER:
+        done = empire.completed
+        # Highest era first: the first hit is the answer
+        for era_key in reversed(self._ERA_ORDER):
             k_items = self._knowledge_era_groups.get(era_key, [])
             b_items = self._building_era_groups.get(era_key, [])
-            if any(iid in done_knowledge for iid in k_items) or any(iid in done_buildings for iid in b_items):
-                current = era_key
-        return current
+            if any(iid in done for iid in k_items) or any(iid in done for iid in b_items):
+                return era_key
+        return self._ERA_ORDER[0]
 
     # -- Tick ------------------------------------------------------------
 
     def step_all(self, dt: float) -> None:
-        """Advance all registered empires by dt seconds."""
-        for empire in self._empires.values():
-            self.step(empire, dt)
+        """Advance all registered empires by dt seconds.
+
+        A zero (or negative) dt cannot move any resource or queue, so the
+        whole pass is skipped.
+        """
+        if dt <= 0:
+            return
+        step = self.step
+        for empire in self._empires_list:
+            step(empire, dt)
 
     def step(self, empire: Empire, dt: float) -> None:
-        """Advance a single empire by dt seconds: resources, building, research."""
-        self._generate_resources(empire, dt)
-        self._progress_buildings(empire, dt)
-        self._progress_knowledge(empire, dt)
+        """Advance a single empire by dt seconds: resources, building, research.
+
+        Idle empires (no income, nothing queued) return without touching
+        their dicts. The sub-steps stay separate methods so they can be
+        driven individually; step() only calls the ones with work to do and
+        reads the cached coefficients inline.
+        """
+        coeffs = empire.tick_coefficients
+        if coeffs is None:
+            coeffs = self._build_tick_coefficients(empire)
+        if coeffs.income_mask:
+            self._generate_resources(empire, dt, coeffs)
+        if empire.build_queue is not None:
+            self._progress_buildings(empire, dt)
+        if empire.research_queue is not None:
+            self._progress_knowledge(empire, dt)
 
     # -- Resource generation ---------------------------------------------
 
-    def _generate_resources(self, empire: Empire, dt: float) -> None:
-        """Generate gold and culture based on citizens and effects."""
-        eff_citizen_effect = self.effective_citizen_effect(empire)
+    def _generate_resources(
+        self, empire: Empire, dt: float, coeffs: TickCoefficients | None = None,
+    ) -> None:
+        """Generate gold and culture based on citizens and effects.
+
+        Effect-derived terms come from ``coeffs`` (step() passes the cached
+        TickCoefficients); when called on its own they are rebuilt from the
+        current effects. Only the citizen counts are read live. Resource keys
+        are seeded on register, so each update is one read and one write.
+        """
+        c = coeffs if coeffs is not None else self._build_tick_coefficients(empire)
+        res = empire.resources
+        citizens = empire.citizens
+        citizen_effect = c.citizen_effect
 
         # Gold: base * modifier + offset
-        merchant_count = empire.citizens.get("merchant", 0)
-        artist_count = empire.citizens.get("artist", 0)
-        scientist_count_g = empire.citizens.get("scientist", 0)
-        gold_modifier = merchant_count * eff_citizen_effect
-        gold_modifier += (artist_count + scientist_count_g) * empire.get_effect("other_citizen_gold_modifier", 0.0)
-        gold_modifier += empire.get_effect("gold_modifier", 0.0)
-        gold_offset = empire.get_effect("gold_offset", 0.0)
-        empire.resources["gold"] += ((self._base_gold + gold_offset) * (1 + gold_modifier)) * dt
+        merchant_count = citizens.get("merchant", 0)
+        artist_count = citizens.get("artist", 0)
+        scientist_count_g = citizens.get("scientist", 0)
+        gold_modifier = merchant_count * citizen_effect
+        gold_modifier += (artist_count + scientist_count_g) * c.other_citizen_gold_modifier
+        gold_modifier += c.gold_modifier
+        gold = res["gold"]
+        res["gold"] = gold + (c.gold_base * (1 + gold_modifier)) * dt
 
         # Culture: base * modifier + offset
-        culture_modifier = artist_count * eff_citizen_effect
-        culture_modifier += empire.get_effect("culture_modifier", 0.0)
-        culture_offset = empire.get_effect("culture_offset", 0.0)
-        empire.resources["culture"] += ((self._base_culture + culture_offset) * (1 + culture_modifier)) * dt
-
-        life_regen_modifier = empire.get_effect("life_regen_modifier", 0.0)
-        if life_regen_modifier > 0:
-            regen = life_regen_modifier
-            battle_boost = empire.get_effect("restore_life_during_battle_modifier", 0.0)
-            if battle_boost > 0:
+        culture_modifier = artist_count * citizen_effect + c.culture_modifier
+        culture = res["culture"]
+        res["culture"] = culture + (c.culture_base * (1 + culture_modifier)) * dt
+
+        if c.life_regen > 0:
+            regen = c.life_regen
+            if c.battle_life_regen > 0:
                 from gameserver.network.handlers._core import _active_battles
                 if empire.uid in _active_battles:
-                    regen += battle_boost
-            empire.resources["life"] = min(
-                empire.resources.get("life", 0.0) + regen * dt,
-                empire.max_life,
-            )
+                    regen += c.battle_life_regen
+            res["life"] = min(res["life"] + regen * dt, empire.max_life)
 
     # -- Build progress --------------------------------------------------
 
@@ -267,27 +363,27 @@ class EmpireService:
             return
 
         iid = empire.build_queue
-        remaining = empire.buildings.get(iid, 0.0)
+        buildings = empire.buildings
+        remaining = buildings.get(iid, 0.0)
         if remaining <= 0:
             empire.build_queue = None
             return
 
         # Build speed: (base + offset) * (1 + modifier) * (1 - siege_penalty)
-        speed = (self._base_build_speed + empire.get_effect("build_speed_offset", 0.0)) * (1.0 + empire.get_effect("build_speed_modifier", 0.0))
+        speed = self._tick_coefficients(empire).build_speed
         siege_penalty = self._siege_construction_speed_penalty(empire)
         if siege_penalty > 0:
             speed *= (1.0 - siege_penalty)
         remaining -= dt * speed
-        if remaining <= 0:
-            remaining = 0.0
-            empire.build_queue = None
-            empire.buildings[iid] = remaining
-            self._apply_effects(empire, iid)
-            log.info("Empire %d: building %s completed", empire.uid, iid)
-            from gameserver.util.events import ItemCompleted
-            self._events.emit(ItemCompleted(empire_uid=empire.uid, iid=iid))
+        if remaining > 0:
+            buildings[iid] = remaining
             return
-        empire.buildings[iid] = remaining
+        buildings[iid] = 0.0
+        empire.build_queue = None
+        empire.completed.add(iid)
+        self._apply_effects(empire, iid)
+        log.info("Empire %d: building %s completed", empire.uid, iid)
+        self._events.emit(ItemCompleted(empire_uid=empire.uid, iid=iid))
 
     def _siege_construction_speed_penalty(self, empire: Empire) -> float:
         """Return the fractional build speed reduction caused by in-siege attackers.
@@ -305,10 +401,11 @@ class EmpireService:
         )
         if siege_count == 0:
             return 0.0
-        per_army = self._siege_construction_per_army - empire.get_effect("siege_construction_speed_per_army_modifier", 0.0)
+        effect = empire.effects.get
+        per_army = self._siege_construction_per_army - effect("siege_construction_speed_per_army_modifier", 0.0)
         per_army = max(0.0, per_army)
         raw = siege_count * per_army
-        max_penalty = empire.get_effect("max_siege_construction_speed_modifier", 0.0)
+        max_penalty = effect("max_siege_construction_speed_modifier", 0.0)
         return min(raw, max_penalty) if max_penalty > 0 else raw
 
     def _progress_knowledge(self, empire: Empire, dt: float) -> None:
@@ -317,29 +414,81 @@ class EmpireService:
             return
 
         iid = empire.research_queue
-        remaining = empire.knowledge.get(iid, 0.0)
+        knowledge = empire.knowledge
+        remaining = knowledge.get(iid, 0.0)
         if remaining <= 0:
             empire.research_queue = None
             return
 
         # Research speed: (base + offset) * (1 + modifier + n_scientists * citizen_effect * scientist_bonus)
+        coeffs = self._tick_coefficients(empire)
         scientist_count = empire.citizens.get("scientist", 0)
-        scientist_bonus = 1.0 + empire.get_effect("scientist_citizen_bonus", 0.0)
-        speed = (self._base_research_speed + empire.get_effect("research_speed_offset", 0.0)) * (1.0 + empire.get_effect("research_speed_modifier", 0.0) + scientist_count * self.effective_citizen_effect(empire) * scientist_bonus)
+        speed = coeffs.research_base * (1.0 + coeffs.research_modifier + scientist_count * coeffs.research_per_scientist)
         remaining -= dt * speed
-        if remaining <= 0:
-            remaining = 0.0
-            empire.research_queue = None
-            empire.knowledge[iid] = remaining
-            self._apply_effects(empire, iid)
-            lump = empire.get_effect("gold_lump_sum_after_research", 0.0)
-            if lump > 0:
-                empire.resources["gold"] = empire.resources.get("gold", 0.0) + lump
-            log.info("Empire %d: knowledge %s completed", empire.uid, iid)
-            from gameserver.util.events import ItemCompleted
-            self._events.emit(ItemCompleted(empire_uid=empire.uid, iid=iid))
+        if remaining > 0:
+            knowledge[iid] = remaining
             return
-        empire.knowledge[iid] = remaining
+        knowledge[iid] = 0.0
+        empire.research_queue = None
+        empire.completed.add(iid)
+        self._apply_effects(empire, iid)
+        lump = empire.effects.get("gold_lump_sum_after_research", 0.0)
+        if lump > 0:
+            empire.resources["gold"] = empire.resources.get("gold", 0.0) + lump
+        log.info("Empire %d: knowledge %s completed", empire.uid, iid)
+        self._events.emit(ItemCompleted(empire_uid=empire.uid, iid=iid))
+
+    # -- Tick coefficients -----------------------------------------------
+
+    def _tick_coefficients(self, empire: Empire) -> TickCoefficients:
+        """Return the empire's cached tick rates, rebuilding them if stale.
+
+        :meth:`recalculate_effects` marks the cache stale; anything else that
+        changes ``empire.effects`` must reset ``empire.tick_coefficients`` to
+        None. Scientist counts are read live each tick, so citizen changes
+        need no invalidation.
+        """
+        coeffs = empire.tick_coefficients
+        if coeffs is None:
+            coeffs = self._build_tick_coefficients(empire)
+        return coeffs
+
+    def _build_tick_coefficients(self, empire: Empire) -> TickCoefficients:
+        """Recompute the per-tick rates, income terms and mask from empire.effects.
+
+        Gold and culture scale ``base + offset``, so citizens alone never
+        produce income and the mask depends on effects only.
+        """
+        effect = empire.effects.get
+        citizen_effect = self._citizen_effect + effect("citizen_effect_modifier", 0.0)
+        gold_base = self._base_gold + effect("gold_offset", 0.0)
+        culture_base = self._base_culture + effect("culture_offset", 0.0)
+        life_regen = effect("life_regen_modifier", 0.0)
+        income_mask = 0
+        if gold_base != 0.0:
+            income_mask |= INCOME_GOLD
+        if culture_base != 0.0:
+            income_mask |= INCOME_CULTURE
+        if life_regen > 0:
+            income_mask |= INCOME_LIFE
+        coeffs = TickCoefficients(
+            build_speed=(self._base_build_speed + effect("build_speed_offset", 0.0))
+            * (1.0 + effect("build_speed_modifier", 0.0)),
+            research_base=self._base_research_speed + effect("research_speed_offset", 0.0),
+            research_modifier=effect("research_speed_modifier", 0.0),
+            research_per_scientist=citizen_effect * (1.0 + effect("scientist_citizen_bonus", 0.0)),
+            citizen_effect=citizen_effect,
+            gold_base=gold_base,
+            gold_modifier=effect("gold_modifier", 0.0),
+            other_citizen_gold_modifier=effect("other_citizen_gold_modifier", 0.0),
+            culture_base=culture_base,
+            culture_modifier=effect("culture_modifier", 0.0),
+            life_regen=life_regen,
+            battle_life_regen=effect("restore_life_during_battle_modifier", 0.0),
+            income_mask=income_mask,
+        )
+        empire.tick_coefficients = coeffs
+        return coeffs
 
     # -- Effects ---------------------------------------------------------
 
@@ -350,15 +499,13 @@ class EmpireService:
         the era, which has its own set of effects. Also triggers the end
         rally if this item matches the configured end_criterion.
         """
-        # Measure era before this item counts — temporarily hide it from the era check.
-        if iid in empire.knowledge:
-            _dict: dict[str, float] = empire.knowledge
-        else:
-            _dict = empire.buildings
-        _stored = _dict.get(iid, 0.0)
-        _dict[iid] = 1.0  # mark as unfinished so get_current_era ignores it
+        # Measure era before this item counts — temporarily hide it from the
+        # completed set that get_current_era reads.
+        _was_done = iid in empire.completed
+        empire.completed.discard(iid)
         _era_before = self.get_current_era(empire)
-        _dict[iid] = _stored  # restore
+        if _was_done:
+            empire.completed.add(iid)
         self.recalculate_effects(empire)
         _era_after = self.get_current_era(empire)
         if _era_after != _era_before:
@@ -399,8 +546,6 @@ class EmpireService:
         """If the artifact ratio requires more artifacts in the world, grant one to this empire."""
         import random
         from gameserver.engine.ai_service import AI_UID
-        from gameserver.models.items import ItemType
-        from gameserver.util.eras import ERA_ORDER
         if self._gc is None or self._upgrades is None:
             return
         _min_era_idx = ERA_ORDER.index("bronze")
@@ -418,8 +563,10 @@ class EmpireService:
         )
         if num_accounts == 0 or ratio <= self._gc.accounts_per_artifact:
             return
-        all_artifact_iids = [item.iid for item in self._upgrades.get_by_type(ItemType.ARTIFACT)]
-        candidates = [iid for iid in all_artifact_iids if iid not in empire.artifacts]
+        candidates = [
+            item.iid for item in self._upgrades.iter_by_type(ItemType.ARTIFACT)
+            if item.iid not in empire.artifacts
+        ]
         if not candidates:
             return
         artifact_iid = random.choice(candidates)
@@ -446,44 +593,43 @@ class EmpireService:
         Call this on server startup / state restore to ensure effects
         match the actually completed items.
         """
-        empire.effects.clear()
-        for iid, remaining in empire.buildings.items():
-            if remaining <= 0:
-                effects = self._upgrades.get_effects(iid)
-                for key, value in effects.items():
-                    empire.effects[key] = empire.effects.get(key, 0.0) + value
-        for iid, remaining in empire.knowledge.items():
-            if remaining <= 0:
-                effects = self._upgrades.get_effects(iid)
-                for key, value in effects.items():
-                    empire.effects[key] = empire.effects.get(key, 0.0) + value
-        for iid in empire.artifacts:
-            effects = self._upgrades.get_effects(iid)
-            for key, value in effects.items():
-                empire.effects[key] = empire.effects.get(key, 0.0) + value
+        empire.rebuild_completed()
+        # Accumulate into a fresh local dict (bound .get, no attribute
+        # lookups per key) and swap it in once at the end.
+        totals: dict[str, float] = {}
+        total = totals.get
+        # One merge loop over every effect source; the item list keeps the
+        # buildings → knowledge → artifacts order so float sums are stable.
+        sources = [iid for iid, remaining in empire.buildings.items() if remaining <= 0]
+        sources += [iid for iid, remaining in empire.knowledge.items() if remaining <= 0]
+        sources += empire.artifacts
+        get_effects = self._upgrades.get_effects
+        for iid in sources:
+            for key, value in get_effects(iid).items():
+                totals[key] = total(key, 0.0) + value
         # Apply era-specific effects from game config
         era_effects_all = getattr(self._gc, "era_effects", {})
         era_key = self.get_current_era(empire)
         era_fx = era_effects_all.get(era_key, {})
         for key, value in era_fx.items():
-            empire.effects[key] = empire.effects.get(key, 0.0) + value
+            totals[key] = total(key, 0.0) + value
         # Apply end-rally global effects if active
         if self._gc is not None:
             from gameserver.engine.global_state import is_end_rally_active
             if is_end_rally_active(self._gc):
                 for key, value in self._gc.end_rally_effects.items():
-                    empire.effects[key] = empire.effects.get(key, 0.0) + value
+                    totals[key] = total(key, 0.0) + value
         # Bake game.yaml base for ruler_artifact_steal_bonus so ruler skill effects stack on top
         if self._gc is not None:
             base_ruler_steal = getattr(self._gc, "ruler_artifact_steal_bonus", 0.0)
             if base_ruler_steal:
-                empire.effects["ruler_artifact_steal_bonus"] = (
-                    empire.effects.get("ruler_artifact_steal_bonus", 0.0) + base_ruler_steal
-                )
+                totals["ruler_artifact_steal_bonus"] = total("ruler_artifact_steal_bonus", 0.0) + base_ruler_steal
         # Apply ruler skill effects
         for key, value in self.get_ruler_effects(empire).items():
-            empire.effects[key] = empire.effects.get(key, 0.0) + value
+            totals[key] = total(key, 0.0) + value
+        empire.effects = totals
         self._recalculate_max_life(empire)
+        empire.tick_coefficients = None  # rebuilt from the new effects on next tick
         log.info("Empire %d: recalculated effects → %s", empire.uid, empire.effects)
 
     # Keys that are one-shot payouts on skill-up — must not be stored in empire.effects
@@ -535,15 +681,8 @@ class EmpireService:
         if item is None:
             return f"Unknown item: {iid}"
 
-        # Build completed set for requirement check
-        completed: set[str] = set()
-        for k, v in empire.buildings.items():
-            if v <= 0:
-                completed.add(k)
-        for k, v in empire.knowledge.items():
-            if v <= 0:
-                completed.add(k)
-        completed.update(empire.artifacts)
+        # Completed set for requirement check (maintained on the empire)
+        completed = empire.completed.union(empire.artifacts)
 
         if not self._upgrades.check_requirements(iid, completed):
             return f"Requirements not met for {iid}"
@@ -557,8 +696,6 @@ class EmpireService:
             if comp_item and iid in comp_item.excludes:
                 return f"Cannot build {iid}: excluded by completed item {comp_iid}"
 
-        from gameserver.models.items import ItemType
-
         if item.item_type == ItemType.BUILDING:
             if iid in empire.buildings and empire.buildings[iid] <= 0:
                 return f"Building {iid} already completed"
@@ -566,19 +703,23 @@ class EmpireService:
             is_new_start = iid not in empire.buildings
             # Deduct costs only on first start
             if is_new_start:
-                gold_discount = empire.get_effect("building_cost_modifier", 0.0)
+                gold_factor = max(0.0, 1.0 - empire.get_effect("building_cost_modifier", 0.0))
+                # Check every cost first and remember the new balances, then
+                # commit them — nothing is deducted if any resource is short.
+                resources = empire.resources
+                balances: list[tuple[str, float]] = []
                 for res, cost in item.costs.items():
-                    actual_cost = cost * max(0.0, 1.0 - gold_discount) if res == "gold" else cost
-                    current = empire.resources.get(res, 0.0)
+                    actual_cost = cost * gold_factor if res == "gold" else cost
+                    current = resources.get(res, 0.0)
                     if current < actual_cost:
                         return f"Not enough {res} (need {actual_cost:.1f}, have {current:.1f})"
-                for res, cost in item.costs.items():
-                    actual_cost = cost * max(0.0, 1.0 - gold_discount) if res == "gold" else cost
-                    empire.resources[res] -= actual_cost
+                    balances.append((res, current - actual_cost))
+                resources.update(balances)
             # Enqueue (replace current build queue item)
             # Only set effort if not already started (not in dict or already completed)
             if is_new_start:
                 empire.buildings[iid] = float(item.effort)
+                empire.sync_completed(iid)
             if item.effort > 0:
                 empire.build_queue = iid
             log.info("Empire %d: started building %s (effort=%s)", empire.uid, iid, item.effort)
@@ -590,17 +731,20 @@ class EmpireService:
             is_new_start = iid not in empire.knowledge
             # Deduct costs only on first start
             if is_new_start:
+                resources = empire.resources
+                balances = []
                 for res, cost in item.costs.items():
-                    current = empire.resources.get(res, 0.0)
+                    current = resources.get(res, 0.0)
                     if current < cost:
                         return f"Not enough {res} (need {cost}, have {current:.1f})"
-                for res, cost in item.costs.items():
-                    empire.resources[res] -= cost
+                    balances.append((res, current - cost))
+                resources.update(balances)
             # Enqueue (replace current research queue item)
             # Only set effort if not already started (not in dict or already completed)
             if is_new_start:
                 cost_mod = max(0.0, 1.0 - empire.get_effect("research_cost_modifier", 0.0))
                 empire.knowledge[iid] = float(item.effort) * cost_mod
+                empire.sync_completed(iid)
             if item.effort > 0:
                 empire.research_queue = iid
             log.info("Empire %d: started research %s (effort=%s)", empire.uid, iid, item.effort)
@@ -629,18 +773,18 @@ class EmpireService:
         # Migrate any legacy free citizens to artist
         if empire.citizens.get("free", 0) > 0:
             empire.citizens["artist"] = empire.citizens.get("artist", 0) + empire.citizens.pop("free")
-        n = sum(empire.citizens.values())
+        n = empire.citizen_total
         price = self.citizen_price_for(empire, n + 1)
         if empire.resources.get("culture", 0.0) < price:
             return f"Not enough culture (need {price:.1f}, have {empire.resources.get('culture', 0.0):.1f})"
         _roles = ["artist", "merchant", "scientist"]
         role = _roles[n % len(_roles)]
         empire.citizens[role] = empire.citizens.get(role, 0) + 1
+        empire.citizen_total = n + 1
         return None
 
     def _citizen_price(self, i: int) -> float:
-        p = self._gc.prices.citizen
-        return float(p.u + (i * p.y) * (i + p.z) ** p.v)
+        return _power_price(self._gc.prices.citizen, i)
 
     def citizen_price_for(self, empire: Empire, i: int) -> float:
         """Citizen price with empire's citizen_cost_modifier applied."""
@@ -668,20 +812,16 @@ class EmpireService:
 
     @staticmethod
     def _sigmoid(i: int, maxv: float, minv: float, spread: float, steep: float) -> float:
-        import math
         return minv + (maxv - minv) / (1 + math.exp((-7 * i) / spread + steep))
 
     def _tile_price(self, i: int) -> float:
-        p = self._gc.prices.tile
-        return float(p.u + (i * p.y) * (i + p.z) ** p.v)
+        return _power_price(self._gc.prices.tile, i)
 
     def _wave_price(self, i: int) -> float:
-        p = self._gc.prices.wave
-        return float(p.u + (i * p.y) * (i + p.z) ** p.v)
+        return _power_price(self._gc.prices.wave, i)
 
     def _critter_slot_price(self, i: int) -> float:
-        p = self._gc.prices.critter_slot
-        return float(p.u + (i * p.y) * (i + p.z) ** p.v)
+        return _power_price(self._gc.prices.critter_slot, i)
 
     def critter_slot_price_for(self, empire: Empire, i: int) -> float:
         """Critter slot price with empire's wave_slot_cost_modifier applied."""
@@ -689,16 +829,13 @@ class EmpireService:
         return self._critter_slot_price(i) * max(0.0, 1.0 - discount)
 
     def _army_price(self, i: int) -> float:
-        p = self._gc.prices.army
-        return float(p.u + (i * p.y) * (i + p.z) ** p.v)
+        return _power_price(self._gc.prices.army, i)
 
     def ruler_xp_for_level(self, level: int) -> float:
         """XP required to reach `level` from level-1. Uses powerDecay formula."""
         if self._gc is None:
             return float(level * 100)
-        p = self._gc.prices.ruler_xp
-        n = level - 1
-        return float(p.u + (n * p.y) * (n + p.z) ** p.v)
+        return _power_price(self._gc.prices.ruler_xp, level - 1)
 
     def ruler_level_from_xp(self, xp: float, max_level: int = 18) -> int:
         """Derive ruler level from total accumulated XP."""
@@ -751,33 +888,28 @@ class EmpireService:
         Returns:
             Error message if validation fails, None on success.
         """
-        # Valid citizen roles
-        valid_roles = {"merchant", "scientist", "artist"}
-
         # Migrate any legacy free citizens to artist first
-        if empire.citizens.get("free", 0) > 0:
-            empire.citizens["artist"] = empire.citizens.get("artist", 0) + empire.citizens.pop("free")
-
-        # Get current total (exclude free if still present from old state)
-        current_total = sum(v for k, v in empire.citizens.items() if k != "free")
-        
-        # Validate all keys are valid roles
-        for role in distribution.keys():
-            if role not in valid_roles:
-                return f"Invalid citizen role: {role}"
-        
-        # Validate all values are non-negative
+        citizens = empire.citizens
+        free = citizens.pop("free", 0)
+        if free > 0:
+            citizens["artist"] = citizens.get("artist", 0) + free
+        # Free citizens were migrated above, so the maintained total is exact
+        current_total = empire.citizen_total
+
+        # Validate roles and counts and sum the total in one pass
+        new_total = 0
         for role, count in distribution.items():
-            if not isinstance(count, int) or count < 0:
+            if role not in _CITIZEN_ROLES:
+                return f"Invalid citizen role: {role}"
+            if type(count) is not int or count < 0:
                 return f"Citizen count must be non-negative integer: {role}={count}"
-        
-        # Validate total matches exactly
-        new_total = sum(distribution.values())
+            new_total += count
         if new_total != current_total:
             return f"Total must equal current citizens (expected {current_total}, got {new_total})"
-        
+
         # Apply new distribution (no free citizens)
-        empire.citizens = {k: v for k, v in distribution.items()}
+        empire.citizens = dict(distribution)
+        empire.citizen_total = new_total
         return None
 
 
@@ -20,6 +20,8 @@ import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from gameserver.util.events import BattleStartRequested
+
 if TYPE_CHECKING:
     from gameserver.engine.ai_service import AIService
     from gameserver.engine.attack_service import AttackService
@@ -43,6 +45,14 @@ class GameLoop:
     """
 
     STATE_SAVE_INTERVAL_S: float = 60.0
+    # Ticks the loop may fall behind its schedule before it resyncs instead
+    # of firing the missed ticks back-to-back.
+    MAX_TICK_BACKLOG: int = 5
+    # Fraction of a step the accumulator may be short and still step, so a
+    # wake-up a few microseconds early does not defer the step by a tick.
+    STEP_TOLERANCE: float = 0.01
+    # Smoothing factor of the avg_tick_duration_ms moving average.
+    TICK_DURATION_ALPHA: float = 0.01
 
     def __init__(
         self,
@@ -73,32 +83,77 @@ class GameLoop:
         self.started_at: float = 0.0
         self.last_tick_dt: float = 0.0
         self.last_tick_duration_ms: float = 0.0
+        # Exponential moving average, so it tracks recent tick cost
         self.avg_tick_duration_ms: float = 0.0
-        self._tick_duration_sum: float = 0.0
 
     async def run(self) -> None:
-        """Start the game loop. Runs until stop() is called."""
+        """Start the game loop. Runs until stop() is called.
+
+        Ticks are scheduled against fixed monotonic deadlines, so the time
+        spent in ``_step`` does not push later ticks back. Measured time is
+        accumulated and consumed in fixed steps of ``step_length_ms / 1000``
+        seconds (the fixed-timestep pattern). Catch-up is capped at
+        MAX_TICK_BACKLOG fixed steps per wakeup; anything beyond that is
+        folded into one larger step so no game time is lost. The simulation
+        therefore sees a constant ``dt`` only while it is at most
+        MAX_TICK_BACKLOG steps behind; after a longer stall one step covers
+        the rest of the backlog.
+
+        ``tick_count`` counts simulation steps, and the tick duration gauges
+        are the wakeup's step time divided by its step count. Wakeups that
+        ran no step leave them untouched.
+        """
         self._running = True
-        self.started_at = time.monotonic()
+        # Hot callables bound once for the lifetime of the loop
+        step = self._step
+        monotonic = time.monotonic
+        sleep = asyncio.sleep
+        self.started_at = monotonic()
+        interval = self._step_interval
+        threshold = interval * (1.0 - self.STEP_TOLERANCE)
+        max_steps = self.MAX_TICK_BACKLOG
+        alpha = self.TICK_DURATION_ALPHA
+        save_every = self._save_every_n_ticks
         last = self.started_at
+        next_tick = self.started_at + interval
+        accumulator = 0.0
         while self._running:
-            now = time.monotonic()
+            now = monotonic()
             dt = now - last
             last = now
 
-            t0 = time.monotonic()
-            self._step(dt)
-            elapsed_ms = (time.monotonic() - t0) * 1000
-
-            self.tick_count += 1
-            if self.tick_count % self._save_every_n_ticks == 0:
-                asyncio.ensure_future(self._save_state())
-            self.last_tick_dt = dt
-            self.last_tick_duration_ms = elapsed_ms
-            self._tick_duration_sum += elapsed_ms
-            self.avg_tick_duration_ms = self._tick_duration_sum / self.tick_count
-
-            await asyncio.sleep(self._step_interval)
+            accumulator += dt
+            steps = 0
+            while accumulator >= threshold and steps < max_steps:
+                step(interval)
+                accumulator -= interval
+                steps += 1
+            if accumulator >= threshold:
+                backlog = interval * round(accumulator / interval)
+                step(backlog)
+                accumulator -= backlog
+                steps += 1
+            done = monotonic()
+            elapsed_ms = (done - now) * 1000
+
+            if steps:
+                previous = self.tick_count
+                self.tick_count += steps
+                if self.tick_count // save_every > previous // save_every:
+                    asyncio.ensure_future(self._save_state())
+                self.last_tick_dt = dt
+                step_ms = elapsed_ms / steps
+                self.last_tick_duration_ms = step_ms
+                if previous == 0:
+                    self.avg_tick_duration_ms = step_ms
+                else:
+                    self.avg_tick_duration_ms += alpha * (step_ms - self.avg_tick_duration_ms)
+
+            if done - next_tick > interval * max_steps:
+                _log.warning("Game loop %.1fs behind schedule — resyncing", done - next_tick)
+                next_tick = done
+            await sleep(max(0.0, next_tick - done))
+            next_tick += interval
 
     @property
     def uptime_seconds(self) -> float:
@@ -297,15 +352,16 @@ class GameLoop:
         battles_to_start = self._attacks.step_all(dt)
         
         # 3. Signal battle starts via event bus
-        from gameserver.util.events import BattleStartRequested
-        for attack in battles_to_start:
-            event = BattleStartRequested(
-                attack_id=attack.attack_id,
-                attacker_uid=attack.attacker_uid,
-                defender_uid=attack.defender_uid,
-                army_aid=attack.army_aid,
-            )
-            self._events.emit(event)
+        if battles_to_start:
+            self._events.emit_many([
+                BattleStartRequested(
+                    attack_id=attack.attack_id,
+                    attacker_uid=attack.attacker_uid,
+                    defender_uid=attack.defender_uid,
+                    army_aid=attack.army_aid,
+                )
+                for attack in battles_to_start
+            ])
 
         # 4. Update statistics
         # TODO: self._stats.update()
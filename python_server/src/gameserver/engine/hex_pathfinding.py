@@ -13,8 +13,10 @@ This module provides:
 
 from __future__ import annotations
 
+import functools
 import math
 from collections import deque
+from itertools import pairwise
 from typing import Optional
 
 from gameserver.models.hex import HexCoord
@@ -22,6 +24,22 @@ from gameserver.models.hex import HexCoord
 # sqrt(3) — distance between two adjacent flat-top hex centers in "size=1" space
 _SQRT3 = math.sqrt(3)
 
+# Tile types critters can walk through. A tuple rather than a set: raw
+# empire hex maps mix plain strings with unhashable {'type': ...} dicts.
+_PASSABLE = ('spawnpoint', 'path', 'empty', 'castle')
+
+# Axial offsets of the 6 neighbors (same order as HexCoord.neighbors)
+_NEIGHBOR_OFFSETS: tuple[tuple[int, int], ...] = (
+    (1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1),
+)
+_NEIGHBOR_STEPS = frozenset(_NEIGHBOR_OFFSETS)
+
+
+def _key_to_coords(key: str) -> tuple[int, int]:
+    """Parse a ``"q,r"`` tile key."""
+    q, r = key.split(',')
+    return int(q), int(r)
+
 
 def validate_path(path: list[HexCoord]) -> bool:
     """Check that each consecutive pair in the path are hex neighbors.
@@ -34,7 +52,9 @@ def validate_path(path: list[HexCoord]) -> bool:
     """
     if len(path) < 2:
         return True
-    return all(path[i].distance_to(path[i + 1]) == 1 for i in range(len(path) - 1))
+    # Neighbors differ by exactly one of the 6 axial offsets
+    steps = _NEIGHBOR_STEPS
+    return all((b.q - a.q, b.r - a.r) in steps for a, b in pairwise(path))
 
 
 def find_path_from_spawn_to_castle(tiles: dict[str, str]) -> Optional[list[HexCoord]]:
@@ -43,6 +63,11 @@ def find_path_from_spawn_to_castle(tiles: dict[str, str]) -> Optional[list[HexCo
     Traverses spawnpoint, path, empty, and castle tiles via 6-connected hex neighbors.
     Explicit path tiles are supported for backwards compatibility but are no longer
     required — the shortest route through empty land is used automatically.
+
+    Results are memoized per tile layout (including key order, which decides
+    the spawn tried first), so re-pathing an unchanged map is a cache hit.
+    Each call returns a fresh list. Maps with unhashable tile values (raw
+    ``{'type': ...}`` dicts) are searched without the cache.
     
     Args:
         tiles: Dict of {"q,r": "tile_type"} where tile_type is 'castle', 'spawnpoint', etc.
@@ -50,6 +75,28 @@ def find_path_from_spawn_to_castle(tiles: dict[str, str]) -> Optional[list[HexCo
     Returns:
         List of HexCoord from spawn to castle, or None if no path exists.
     """
+    items = tuple(tiles.items())
+    try:
+        hash(items)
+    except TypeError:
+        return _search_path(tiles)
+    path = _cached_path(items)
+    return list(path) if path is not None else None
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_path(items: tuple[tuple[str, str], ...]) -> tuple[HexCoord, ...] | None:
+    """Memoized BFS keyed by the ordered tile items."""
+    path = _search_path(dict(items))
+    return tuple(path) if path is not None else None
+
+
+def _search_path(tiles: dict[str, str]) -> list[HexCoord] | None:
+    """Uncached BFS behind find_path_from_spawn_to_castle.
+
+    The search runs on ``(q, r)`` int tuples; the tile type of each
+    coordinate is looked up at most once.
+    """
     # Find castle and spawnpoints
     castle_key: Optional[str] = None
     spawn_keys: list[str] = []
@@ -62,60 +109,51 @@ def find_path_from_spawn_to_castle(tiles: dict[str, str]) -> Optional[list[HexCo
     
     if not castle_key or not spawn_keys:
         return None
-    
-    def key_to_coords(k: str) -> tuple[int, int]:
-        q, r = k.split(',')
-        return int(q), int(r)
-    
-    def hex_neighbors(q: int, r: int) -> list[tuple[int, int]]:
-        return [
-            (q + 1, r),
-            (q + 1, r - 1),
-            (q, r - 1),
-            (q - 1, r),
-            (q - 1, r + 1),
-            (q, r + 1),
-        ]
-    
-    def coords_to_key(q: int, r: int) -> str:
-        return f"{q},{r}"
-    
-    castle_q, castle_r = key_to_coords(castle_key)
-    
-    # BFS from each spawnpoint
+
+    castle = _key_to_coords(castle_key)
+    get_tile = tiles.get
+    # Coordinates already resolved to a non-walkable tile; each neighbor's
+    # key is formatted and looked up at most once across all searches.
+    blocked: set[tuple[int, int]] = set()
+
+    # BFS from each spawnpoint; tiles reached by a search that missed the
+    # castle cannot reach it from any later spawn either.
+    dead_end: set[tuple[int, int]] = set()
     for spawn_key in spawn_keys:
-        spawn_q, spawn_r = key_to_coords(spawn_key)
-        
-        queue: deque[tuple[int, int]] = deque([(spawn_q, spawn_r)])
-        visited: set[tuple[int, int]] = {(spawn_q, spawn_r)}
-        parent: dict[tuple[int, int], Optional[tuple[int, int]]] = {(spawn_q, spawn_r): None}
-        
+        spawn = _key_to_coords(spawn_key)
+        if spawn in dead_end:
+            continue
+
+        # parent doubles as the visited set
+        parent: dict[tuple[int, int], Optional[tuple[int, int]]] = {spawn: None}
+        queue: deque[tuple[int, int]] = deque((spawn,))
+        popleft = queue.popleft
+        append = queue.append
         while queue:
-            q, r = queue.popleft()
-            
-            # Reached castle?
-            if (q, r) == (castle_q, castle_r):
-                # Reconstruct path
-                path: list[tuple[int, int]] = []
-                current: Optional[tuple[int, int]] = (q, r)
-                while current is not None:
-                    path.append(current)
-                    current = parent.get(current)
-                path.reverse()
-                return [HexCoord(pq, pr) for pq, pr in path]
-            
-            # Explore neighbors
-            for nq, nr in hex_neighbors(q, r):
-                if (nq, nr) not in visited:
-                    key = coords_to_key(nq, nr)
-                    neighbor_tile: str = tiles.get(key) or ""
-
-                    # Only traverse through passable tiles
-                    if neighbor_tile in ('spawnpoint', 'path', 'empty', 'castle'):
-                        visited.add((nq, nr))
-                        parent[(nq, nr)] = (q, r)
-                        queue.append((nq, nr))
-    
+            node = popleft()
+            q, r = node
+            for dq, dr in _NEIGHBOR_OFFSETS:
+                nq = q + dq
+                nr = r + dr
+                neighbor = (nq, nr)
+                if neighbor in parent or neighbor in blocked:
+                    continue
+                if get_tile(f"{nq},{nr}") not in _PASSABLE:
+                    blocked.add(neighbor)
+                    continue
+                parent[neighbor] = node
+                if neighbor == castle:
+                    # Reconstruct path
+                    path: list[HexCoord] = []
+                    current: Optional[tuple[int, int]] = neighbor
+                    while current is not None:
+                        path.append(HexCoord(*current))
+                        current = parent[current]
+                    path.reverse()
+                    return path
+                append(neighbor)
+        dead_end.update(parent)
+
     return None
 
 
@@ -6,8 +6,14 @@ and requirement checking for all game items.
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+
 from gameserver.models.items import ItemDetails, ItemType
 
+_EMPTY: Mapping[str, float] = MappingProxyType({})
+
 
 class UpgradeProvider:
     """Tech tree database — read-only after initialization.
@@ -18,10 +24,28 @@ class UpgradeProvider:
 
     def __init__(self) -> None:
         self.items: dict[str, ItemDetails] = {}
+        # Derived lookups, rebuilt lazily whenever ``items`` is replaced
+        self._index_source: dict[str, ItemDetails] | None = None
+        self._by_type: dict[ItemType, list[tuple[ItemDetails, frozenset[str]]]] = {}
+        self._requirements: dict[str, frozenset[str]] = {}
 
     def load(self, items: list[ItemDetails]) -> None:
-        """Load item definitions into the provider."""
-        self.items = {item.iid: item for item in items}
+        """Load item definitions into the provider (IIDs are interned)."""
+        self.items = {sys.intern(item.iid): item for item in items}
+
+    def _ensure_index(self) -> None:
+        """(Re)build the per-type and requirement indexes for ``items``."""
+        if self._index_source is self.items:
+            return
+        by_type: dict[ItemType, list[tuple[ItemDetails, frozenset[str]]]] = {}
+        requirements: dict[str, frozenset[str]] = {}
+        for iid, item in self.items.items():
+            reqs = frozenset(item.requirements)
+            requirements[iid] = reqs
+            by_type.setdefault(item.item_type, []).append((item, reqs))
+        self._by_type = by_type
+        self._requirements = requirements
+        self._index_source = self.items
 
     def get(self, iid: str) -> ItemDetails | None:
         """Look up an item by IID."""
@@ -29,39 +53,47 @@ class UpgradeProvider:
 
     def get_by_type(self, item_type: ItemType) -> list[ItemDetails]:
         """Return all items of a given type."""
-        return [i for i in self.items.values() if i.item_type == item_type]
+        self._ensure_index()
+        return [i for i, _ in self._by_type.get(item_type, ())]
+
+    def iter_by_type(self, item_type: ItemType) -> Iterator[ItemDetails]:
+        """Iterate the items of a given type without building a list."""
+        self._ensure_index()
+        for item, _ in self._by_type.get(item_type, ()):
+            yield item
 
     def check_requirements(self, iid: str, completed: set[str]) -> bool:
         """Check if all prerequisites for an item are met."""
-        item = self.items.get(iid)
-        if item is None:
+        self._ensure_index()
+        requirements = self._requirements.get(iid)
+        if requirements is None:
             return False
-        return all(req in completed for req in item.requirements)
+        return requirements <= completed
+
+    def get_costs(self, iid: str) -> Mapping[str, float]:
+        """Return the resource costs for an item.
 
-    def get_costs(self, iid: str) -> dict[str, float]:
-        """Return the resource costs for an item."""
+        Like :meth:`get_effects`, the item's own row is returned without
+        copying; treat it as read-only.
+        """
         item = self.items.get(iid)
-        return dict(item.costs) if item else {}
+        return item.costs if item and item.costs else _EMPTY
+
+    def get_effects(self, iid: str) -> Mapping[str, float]:
+        """Return the passive effects granted by an item.
 
-    def get_effects(self, iid: str) -> dict[str, float]:
-        """Return the passive effects granted by an item."""
+        The item's own effect row is returned without copying (this runs for
+        every completed item on each effect recalculation); treat it as
+        read-only.
+        """
         item = self.items.get(iid)
-        return dict(item.effects) if item and item.effects else {}
+        return item.effects if item and item.effects else _EMPTY
 
     def available_critters(self, completed: set[str]) -> list[ItemDetails]:
         """Return all critter types whose requirements are met."""
-        return [
-            i
-            for i in self.items.values()
-            if i.item_type == ItemType.CRITTER
-            and all(req in completed for req in i.requirements)
-        ]
+        return self.available_items(ItemType.CRITTER, completed)
 
     def available_items(self, item_type: ItemType, completed: set[str]) -> list[ItemDetails]:
         """Return all items of *item_type* whose requirements are met."""
-        return [
-            i
-            for i in self.items.values()
-            if i.item_type == item_type
-            and all(req in completed for req in i.requirements)
-        ]
+        self._ensure_index()
+        return [i for i, reqs in self._by_type.get(item_type, ()) if reqs <= completed]
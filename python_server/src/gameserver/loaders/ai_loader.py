@@ -8,7 +8,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
+from gameserver.loaders.yaml_loader import safe_load
 
 
 def load_ai_templates(path: str | Path = "config/ai_templates.yaml") -> dict[str, Any]:
@@ -24,7 +24,7 @@ def load_ai_templates(path: str | Path = "config/ai_templates.yaml") -> dict[str
     if not path.exists():
         return {}
     with path.open() as f:
-        data = yaml.safe_load(f) or {}
+        data = safe_load(f) or {}
     return data
 
 
@@ -43,5 +43,5 @@ def load_ai_waves(path: str | Path = "config/ai_waves.yaml") -> list[dict[str, A
     if not path.exists():
         return []
     with path.open() as f:
-        data = yaml.safe_load(f) or {}
+        data = safe_load(f) or {}
     return data.get("armies") or []
@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict
 
-import yaml
+from gameserver.loaders.yaml_loader import safe_load
 
 log = logging.getLogger(__name__)
 
@@ -230,6 +230,28 @@ class GameConfig:
     uid_ai: int = 2
 
 
+# Flat scalar keys game.yaml must define
+_REQUIRED_SCALAR_KEYS: tuple[str, ...] = (
+    "base_gold_per_sec", "base_culture_per_sec", "citizen_effect",
+    "base_build_speed", "base_research_speed",
+    "starting_max_life", "restore_life_after_loss_offset",
+    "min_lose_knowledge", "max_lose_knowledge",
+    "min_lose_culture", "max_lose_culture",
+    "culture_era_advantage_ratio",
+    "base_artifact_steal_victory", "base_artifact_steal_defeat",
+    "ruler_xp_per_kill", "ruler_xp_per_reached_per_era", "ruler_xp_victory_per_era",
+    "item_upgrade_base_costs",
+    "end_criterion",
+    "empire_spawn_spacing",
+)
+
+# GameConfig fields filled straight from the remaining flat keys of game.yaml
+# (the section-derived fields are passed explicitly by load_game_config).
+_FLAT_CONFIG_FIELDS = frozenset(GameConfig.__dataclass_fields__) - {
+    "era_effects", "barbarians_aggressiveness", "end_rally_effects",
+}
+
+
 def _require(d: dict[str, object], key: str, context: str = "game.yaml") -> object:
     """Raise ValueError if key is missing from dict."""
     if key not in d:
@@ -254,7 +276,7 @@ def load_game_config(path: str = DEFAULT_GAME_CONFIG_PATH) -> GameConfig:
         raise FileNotFoundError(f"Game config not found at {p} — this file is required")
 
     with p.open() as f:
-        raw = yaml.safe_load(f) or {}
+        raw = safe_load(f) or {}
 
     log.info("Loaded game config from %s (%d keys)", p, len(raw))
 
@@ -345,19 +367,6 @@ def load_game_config(path: str = DEFAULT_GAME_CONFIG_PATH) -> GameConfig:
         raw["end_rally_duration"] = raw.pop("end_ralley_duration")
 
     # -- required flat scalar keys ---------------------------------------
-    _REQUIRED_SCALAR_KEYS = [
-        "base_gold_per_sec", "base_culture_per_sec", "citizen_effect",
-        "base_build_speed", "base_research_speed",
-        "starting_max_life", "restore_life_after_loss_offset",
-        "min_lose_knowledge", "max_lose_knowledge",
-        "min_lose_culture", "max_lose_culture",
-        "culture_era_advantage_ratio",
-        "base_artifact_steal_victory", "base_artifact_steal_defeat",
-        "ruler_xp_per_kill", "ruler_xp_per_reached_per_era", "ruler_xp_victory_per_era",
-        "item_upgrade_base_costs",
-        "end_criterion",
-        "empire_spawn_spacing",
-    ]
     for key in _REQUIRED_SCALAR_KEYS:
         _require(raw, key)
 
@@ -370,10 +379,6 @@ def load_game_config(path: str = DEFAULT_GAME_CONFIG_PATH) -> GameConfig:
         structure_upgrades=structure_upgrades,
         critter_upgrades=critter_upgrades,
         end_rally_effects=end_rally_effects,
-        **{
-            k: v for k, v in raw.items()
-            if k in GameConfig.__dataclass_fields__
-            and k not in ("era_effects", "barbarians_aggressiveness", "end_rally_effects")
-        },
+        **{k: v for k, v in raw.items() if k in _FLAT_CONFIG_FIELDS},
     )
     return cfg
@@ -10,13 +10,13 @@ Supports two modes:
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from pathlib import Path
 
-import yaml
-
 from gameserver.models.items import ItemDetails, ItemType
+from gameserver.loaders.yaml_loader import safe_load
 
 # Category keys and the file stems they map to.
 _CATEGORIES = ("buildings", "knowledge", "structures", "critters", "artifacts", "wonders")
@@ -28,6 +28,11 @@ def _type_for_category(cat: str) -> ItemType:
     return ItemType(singular)
 
 
+def _interned(mapping: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of mapping with interned string keys."""
+    return {sys.intern(key): value for key, value in mapping.items()}
+
+
 def _parse_section(type_key: str, section: dict[str, Any]) -> list[ItemDetails]:
     """Parse a single category section dict into ItemDetails."""
     item_type = _type_for_category(type_key)
@@ -35,16 +40,19 @@ def _parse_section(type_key: str, section: dict[str, Any]) -> list[ItemDetails]:
     for iid, attrs in (section or {}).items():
         if not isinstance(attrs, dict):
             continue
+        # IIDs and effect/cost keys end up as dict keys in every empire;
+        # interning them makes those lookups hit the identity fast path.
+        iid = sys.intern(iid)
         items.append(ItemDetails(
             iid=iid,
             name=attrs.get("name", iid),
             description=attrs.get("description", ""),
             item_type=item_type,
             effort=float(attrs.get("effort", 0)),
-            costs=attrs.get("costs", {}),
-            requirements=attrs.get("requirements", []),
+            costs=_interned(attrs.get("costs") or {}),
+            requirements=[sys.intern(req) for req in attrs.get("requirements") or []],
             excludes=attrs.get("excludes", []),
-            effects=attrs.get("effects") or {},
+            effects=_interned(attrs.get("effects") or {}),
             damage=float(attrs.get("damage", 0)),
             range=float(attrs.get("range", 0)),
             reload_time_ms=float(attrs.get("reload_time", 0)),
@@ -96,12 +104,12 @@ def load_items(path: str | Path = "config") -> list[ItemDetails]:
             if not cat_file.exists():
                 continue
             with cat_file.open() as f:
-                data = yaml.safe_load(f) or {}
+                data = safe_load(f) or {}
             items.extend(_parse_section(cat, data))
     else:
         # ── Single-file legacy mode ────────────────────────
         with path.open() as f:
-            data = yaml.safe_load(f) or {}
+            data = safe_load(f) or {}
         for cat in _CATEGORIES:
             section = data.get(cat, {}) or {}
             items.extend(_parse_section(cat, section))
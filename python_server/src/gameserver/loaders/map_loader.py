@@ -13,11 +13,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from gameserver.models.hex import HexCoord
 from gameserver.models.map import HexMap
 from gameserver.engine.hex_pathfinding import find_path_from_spawn_to_castle
+from gameserver.loaders.yaml_loader import safe_load
 
 
 def load_map(path: str | Path) -> HexMap:
@@ -33,7 +32,7 @@ def load_map(path: str | Path) -> HexMap:
     """
     path = Path(path)
     with path.open() as f:
-        data: dict[str, Any] = yaml.safe_load(f) or {}
+        data: dict[str, Any] = safe_load(f) or {}
 
     # Check if this is the new format (tiles dict) or old format (paths + build_tiles)
     if "tiles" in data:
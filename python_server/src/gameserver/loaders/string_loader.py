@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
+from gameserver.loaders.yaml_loader import safe_load
 
 
 def load_strings(path: str | Path) -> dict[str, str]:
@@ -21,5 +21,5 @@ def load_strings(path: str | Path) -> dict[str, str]:
     """
     path = Path(path)
     with path.open() as f:
-        data = yaml.safe_load(f) or {}
+        data = safe_load(f) or {}
     return {str(k): str(v) for k, v in data.items()}
@@ -0,0 +1,22 @@
+"""Shared YAML parsing for the config loaders.
+
+Uses libyaml's ``CSafeLoader`` when PyYAML was built with it and falls back
+to the pure-Python ``SafeLoader`` otherwise. Both accept the same safe
+subset of YAML.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Parse a YAML document with the fastest available safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
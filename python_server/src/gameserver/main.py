@@ -16,13 +16,14 @@ Usage:
 
 from __future__ import annotations
 
+import argparse
 import asyncio
 import logging
 import logging.handlers
 import structlog
 import signal
-import sys
 import os
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
@@ -39,6 +40,8 @@ from gameserver.engine.upgrade_provider import UpgradeProvider
 from gameserver.loaders.ai_loader import load_ai_waves
 from gameserver.loaders.item_loader import load_items
 from gameserver.loaders.map_loader import load_map
+from gameserver.loaders.yaml_loader import safe_load
+from gameserver.models.items import ItemDetails, ItemType
 from gameserver.models.map import HexMap
 from gameserver.engine.bot_detection import BotDetector
 from gameserver.network.auth import AuthService
@@ -47,11 +50,8 @@ from gameserver.network.server import Server
 from gameserver.persistence.database import Database
 from gameserver.persistence.state_load import load_state
 from gameserver.engine.global_state import set_season, set_season_reset_triggered
-from gameserver.persistence.state_save import save_state
 from gameserver.util.events import EventBus, BattleFinished, AttackArrived, ItemCompleted
 from gameserver.models.empire import Empire
-from gameserver.network.handlers import register_all_handlers
-from gameserver.network.handlers._core import _active_battles
 from gameserver.loaders.game_config_loader import GameConfig, load_game_config
 
 log = structlog.get_logger(__name__)
@@ -68,7 +68,7 @@ DEFAULT_MESSAGES_PATH = "messages.yaml"
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Configuration:
     """Holds all data loaded from config files."""
 
@@ -88,7 +88,7 @@ class Configuration:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Services:
     """Holds references to all engine services."""
 
@@ -121,10 +121,9 @@ class Services:
 
 def _load_era_groups_from_yaml(yaml_path: Path) -> dict[str, list[str]]:
     """Build era → [iid] mapping from explicit era: fields in a YAML file."""
-    import yaml as _yaml
     result: dict[str, list[str]] = {}
     try:
-        data = _yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
+        data = safe_load(yaml_path.read_text(encoding="utf-8")) or {}
     except OSError:
         log.warning("Could not read %s for era groups", yaml_path)
         return result
@@ -137,13 +136,21 @@ def _load_era_groups_from_yaml(yaml_path: Path) -> dict[str, list[str]]:
     return result
 
 
+def _era_groups_from_items(items: list[ItemDetails]) -> dict[ItemType, dict[str, list[str]]]:
+    """Build item type → era → [iid] mappings from the era fields of loaded items."""
+    result: dict[ItemType, dict[str, list[str]]] = {}
+    for item in items:
+        if item.era:
+            result.setdefault(item.item_type, {}).setdefault(item.era, []).append(item.iid)
+    return result
+
+
 def _load_rulers(yaml_path: Path) -> "dict[str, Any]":
     """Load rulers.yaml → dict keyed by ruler IID."""
-    import yaml as _yaml
     if not yaml_path.exists():
         return {}
     try:
-        data = _yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
+        data = safe_load(yaml_path.read_text(encoding="utf-8")) or {}
     except OSError:
         log.warning("Could not read %s for rulers", yaml_path)
         return {}
@@ -232,16 +239,26 @@ def load_configuration(
     game_cfg = load_game_config(os.path.join(config_dir, "game.yaml"))
     log.info("  game_config:  loaded")
 
-    knowledge_era_groups = _load_era_groups_from_yaml(Path(config_dir) / "knowledge.yaml")
+    # load_items has already parsed the category files when it read them from
+    # config_dir; take the era groups from the items instead of re-reading.
+    by_type = _era_groups_from_items(items) if Path(items_path) == Path(config_dir) else None
+
+    def _era_groups(cat_yaml: str, item_type: ItemType) -> dict[str, list[str]]:
+        if by_type is not None:
+            return by_type.get(item_type, {})
+        return _load_era_groups_from_yaml(Path(config_dir) / cat_yaml)
+
+    knowledge_era_groups = _era_groups("knowledge.yaml", ItemType.KNOWLEDGE)
     log.info("  knowledge_era_groups: %d eras", len(knowledge_era_groups))
 
-    building_era_groups = _load_era_groups_from_yaml(Path(config_dir) / "buildings.yaml")
+    building_era_groups = _era_groups("buildings.yaml", ItemType.BUILDING)
     log.info("  building_era_groups: %d eras", len(building_era_groups))
 
     from gameserver.util.eras import ERA_ORDER as _ERA_ORDER_LIST
     item_era_index: dict[str, int] = {}
-    for _cat_yaml in ("structures.yaml", "critters.yaml"):
-        for _era, _iids in _load_era_groups_from_yaml(Path(config_dir) / _cat_yaml).items():
+    for _cat_yaml, _type in (("structures.yaml", ItemType.STRUCTURE),
+                             ("critters.yaml", ItemType.CRITTER)):
+        for _era, _iids in _era_groups(_cat_yaml, _type).items():
             _idx = _ERA_ORDER_LIST.index(_era) if _era in _ERA_ORDER_LIST else 0
             for _iid in _iids:
                 item_era_index[_iid] = _idx
@@ -407,26 +424,28 @@ def wire_events(services: Services) -> None:
     _battle_svc = services.battle_service
     _statistics = services.statistics
 
-    # Battle outcomes → empire
-    bus.on(BattleFinished, lambda evt: _empire_svc.on_battle_finished(evt)
-           if hasattr(_empire_svc, "on_battle_finished") else None)
-
-    # Attack arrival → battle
-    bus.on(AttackArrived, lambda evt: _battle_svc.on_attack_arrived(evt)
-           if hasattr(_battle_svc, "on_attack_arrived") else None)
-
-    # Item completed → statistics
-    bus.on(ItemCompleted, lambda evt: _statistics.on_item_completed(evt)
-           if hasattr(_statistics, "on_item_completed") else None)
+    # Optional hooks are resolved once here instead of on every dispatch;
+    # services without the hook simply get no subscription.
+    hooks = (
+        (BattleFinished, _empire_svc, "on_battle_finished"),   # Battle outcomes → empire
+        (AttackArrived, _battle_svc, "on_attack_arrived"),     # Attack arrival → battle
+        (ItemCompleted, _statistics, "on_item_completed"),     # Item completed → statistics
+    )
+    for event_type, service, name in hooks:
+        handler = getattr(service, name, None)
+        if handler is not None:
+            bus.on(event_type, handler)
 
     # Item completed → AI scripted wave triggers
     if services.ai_service is not None:
-        _ai = services.ai_service
         assert services.attack_service is not None
+        _ai_on_item_completed = services.ai_service.on_item_completed
         _atk = services.attack_service
-        bus.on(ItemCompleted, lambda evt: _ai.on_item_completed(
-            evt.empire_uid, evt.iid, _empire_svc, _atk
-        ))
+
+        def _trigger_ai_waves(evt: ItemCompleted) -> None:
+            _ai_on_item_completed(evt.empire_uid, evt.iid, _empire_svc, _atk)
+
+        bus.on(ItemCompleted, _trigger_ai_waves)
 
     log.info("  event handlers registered")
 
@@ -450,6 +469,12 @@ async def start_network(services: Services, state_file: str = "state.yaml") -> N
     assert services.server is not None
     assert services.game_config is not None
 
+    from gameserver.network.handlers import register_all_handlers
+    from gameserver.persistence.state_save import (
+        _save_state_locked,
+        state_file_lock,
+    )
+
     # Register all message handlers on the router
     register_all_handlers(services)
 
@@ -474,13 +499,22 @@ async def start_network(services: Services, state_file: str = "state.yaml") -> N
         port=rest_port,
         log_level="warning",
         access_log=False,
+        lifespan="off",  # the app registers no startup/shutdown handlers
     )
     rest_server = uvicorn.Server(config)
     # Store reference for shutdown
     services._rest_server = rest_server
     # Start as background task (non-blocking); keep task ref for clean await on shutdown
     services._rest_task = asyncio.create_task(rest_server.serve())
-    log.info("  REST API listening on http://0.0.0.0:%d", rest_port)
+    # Wait (up to 5 s) until the port is bound before reporting readiness
+    for _ in range(500):
+        if rest_server.started or services._rest_task.done():
+            break
+        await asyncio.sleep(0.01)
+    if rest_server.started:
+        log.info("  REST API listening on http://0.0.0.0:%d", rest_port)
+    else:
+        log.warning("  REST API not listening on port %d yet", rest_port)
 
 
     async def _backup_loop(_state_file: str = state_file) -> None:
@@ -504,17 +538,26 @@ async def start_network(services: Services, state_file: str = "state.yaml") -> N
             if services.empire_service is None:
                 continue
             try:
-                await save_state(
-                    empires=services.empire_service.all_empires,
-                    attacks=services.attack_service.get_all_attacks() if services.attack_service else [],
-                    battles=[],
-                    path=_state_file,
-                )
                 now = datetime.now(timezone.utc)
+                slot = f"{hour_slot:02d}"
+                today = now.weekday()
+                day = f"day{today}"
+                daily_due = today != last_daily_day
+
+                # Hold the state-file lock so no other save replaces the file
+                # between writing it and copying it into the backup slots.
+                async with state_file_lock():
+                    await _save_state_locked(
+                        empires=services.empire_service.all_empires,
+                        attacks=services.attack_service.get_all_attacks() if services.attack_service else [],
+                        battles=[],
+                        path=_state_file,
+                    )
+                    shutil.copy2(_state_file, hourly_dir / f"state_{slot}.yaml")
+                    if daily_due:
+                        shutil.copy2(_state_file, daily_dir / f"state_{day}.yaml")
 
                 # Hourly rolling backup (slots 00–23)
-                slot = f"{hour_slot:02d}"
-                shutil.copy2(_state_file, hourly_dir / f"state_{slot}.yaml")
                 if db_path and Path(db_path).exists():
                     hourly_db = hourly_dir / f"gameserver_{slot}.db"
                     hourly_db.unlink(missing_ok=True)
@@ -525,10 +568,7 @@ async def start_network(services: Services, state_file: str = "state.yaml") -> N
                 hour_slot = (hour_slot + 1) % 24
 
                 # Daily rolling backup (slots 0–6, one per weekday)
-                today = now.weekday()
-                if today != last_daily_day:
-                    day = f"day{today}"
-                    shutil.copy2(_state_file, daily_dir / f"state_{day}.yaml")
+                if daily_due:
                     if db_path and Path(db_path).exists():
                         daily_db = daily_dir / f"gameserver_{day}.db"
                         daily_db.unlink(missing_ok=True)
@@ -561,6 +601,9 @@ async def start_game_loop(services: Services, state_file: str = "state.yaml") ->
     Args:
         services: All instantiated services.
     """
+    from gameserver.network.handlers._core import _active_battles
+    from gameserver.persistence.state_save import save_state
+
     log.info("Starting game loop …")
     assert services.game_loop is not None
     _game_loop = services.game_loop
@@ -575,7 +618,11 @@ async def start_game_loop(services: Services, state_file: str = "state.yaml") ->
         _game_loop.stop()
 
     for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, _request_shutdown)
+        try:
+            loop.add_signal_handler(sig, _request_shutdown)
+        except NotImplementedError:
+            # Event loops without signal support (e.g. on Windows)
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(_request_shutdown))
 
     log.info("  game loop running (1 s tick)")
     await _game_loop.run()
@@ -727,27 +774,34 @@ def _add_test_empire(services: Services) -> None:
 
 def main() -> None:
     """Entry point for the game server.
-    
+
     Supports command-line arguments:
         --state_file <path>  Use custom state file for restoration (default: state.yaml)
+        --db_file <path>     Use custom SQLite database (default: gameserver.db)
+        --config_dir <path>  Load configuration from this directory (default: config)
     """
-    config_dir = "config"
-    state_file = "state.yaml"
-    db_file = DEFAULT_DB_PATH
-
-    def _get_arg(flag: str) -> str | None:
-        if flag in sys.argv:
-            idx = sys.argv.index(flag)
-            if idx + 1 < len(sys.argv):
-                return sys.argv[idx + 1]
-            print(f"Error: {flag} requires an argument", file=sys.stderr)
-            sys.exit(1)
-        return None
-
-    state_file = _get_arg("--state_file") or state_file
-    db_file = _get_arg("--db_file") or db_file
-
-    asyncio.run(_start(config_dir=config_dir, state_file=state_file, db_file=db_file))
+    parser = argparse.ArgumentParser(prog="gameserver")
+    parser.add_argument("--state_file", default="state.yaml")
+    parser.add_argument("--db_file", default=DEFAULT_DB_PATH)
+    parser.add_argument("--config_dir", default=DEFAULT_ITEMS_PATH)
+    args = parser.parse_args()
+    config_dir: str = args.config_dir
+    state_file: str = args.state_file
+    db_file: str = args.db_file
+
+    # uvloop is optional; when installed its C event loop replaces asyncio's.
+    loop_factory: Callable[[], asyncio.AbstractEventLoop] | None
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+
+    asyncio.run(
+        _start(config_dir=config_dir, state_file=state_file, db_file=db_file),
+        loop_factory=loop_factory,
+    )
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class CritterWave:
     """A wave of critters within an army.
 
@@ -31,7 +31,7 @@ class CritterWave:
     next_critter_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Army:
     """An attacking army consisting of multiple critter waves.
 
@@ -52,7 +52,7 @@ class Army:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class SpyArmy:
     """A spy army variant — gathers intelligence instead of attacking.
 
@@ -6,7 +6,7 @@ and eventually triggering a battle.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
@@ -20,7 +20,7 @@ class AttackPhase(Enum):
     FINISHED = "finished"
 
 
-@dataclass
+@dataclass(slots=True)
 class Attack:
     """State of an in-progress attack.
 
@@ -37,6 +37,8 @@ class Attack:
         wave_pointer: Index of current wave being spawned.
         critter_pointer: Number of critters spawned in current wave.
         next_wave_ms: Countdown to next wave dispatch.
+        _observers: UIDs of players currently watching the battle. Runtime
+            only; not persisted.
     """
 
     attack_id: int
@@ -51,4 +53,5 @@ class Attack:
     is_spy: bool = False  # spy attacks end immediately at IN_SIEGE instead of battling
     army_name_override: str = ""  # used by spy attacks whose army_aid is a virtual ID
     fake_wave_info: "dict[str, Any] | None" = None  # spy: first wave of disguised army, for defense-view preview
+    _observers: set[int] = field(default_factory=set, init=False, repr=False, compare=False)
 
@@ -20,7 +20,7 @@ if TYPE_CHECKING:
     from gameserver.persistence.replay import ReplayRecorder
 
 
-@dataclass
+@dataclass(slots=True)
 class BattleState:
     """Mutable state container for an active tower-defense battle.
 
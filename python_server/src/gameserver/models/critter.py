@@ -21,7 +21,7 @@ class DamageType:
     SPLASH = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class Critter:
     """A single critter on the battlefield.
 
@@ -14,7 +14,7 @@ from gameserver.models.critter import Critter
 from gameserver.models.structure import Structure
 
 
-@dataclass
+@dataclass(slots=True)
 class Ruler:
     """The named ruler of an empire."""
 
@@ -29,7 +29,53 @@ class Ruler:
     aura_choice: str = ""
 
 
-@dataclass
+# Bits of TickCoefficients.income_mask
+INCOME_GOLD = 1
+INCOME_CULTURE = 2
+INCOME_LIFE = 4
+
+
+@dataclass(slots=True)
+class TickCoefficients:
+    """Per-tick rates derived from an empire's effects.
+
+    Effects only change when items complete, so these are cached on the
+    empire and rebuilt by the EmpireService when effects are recalculated.
+
+    Attributes:
+        build_speed: Construction speed before any siege penalty.
+        research_base: Base research speed including the offset.
+        research_modifier: Flat research speed modifier.
+        research_per_scientist: Research modifier added per scientist.
+        citizen_effect: Per-citizen modifier including citizen_effect_modifier.
+        gold_base: Gold per second before modifiers (base + gold_offset).
+        gold_modifier: Flat gold modifier.
+        other_citizen_gold_modifier: Gold modifier per artist/scientist.
+        culture_base: Culture per second before modifiers (base + offset).
+        culture_modifier: Flat culture modifier.
+        life_regen: Life regenerated per second outside battle.
+        battle_life_regen: Extra life per second while in battle.
+        income_mask: Bitmask of the resources that change per tick
+            (``INCOME_GOLD``, ``INCOME_CULTURE``, ``INCOME_LIFE``); 0 for
+            an empire whose resources stay constant.
+    """
+
+    build_speed: float = 0.0
+    research_base: float = 0.0
+    research_modifier: float = 0.0
+    research_per_scientist: float = 0.0
+    citizen_effect: float = 0.0
+    gold_base: float = 0.0
+    gold_modifier: float = 0.0
+    other_citizen_gold_modifier: float = 0.0
+    culture_base: float = 0.0
+    culture_modifier: float = 0.0
+    life_regen: float = 0.0
+    battle_life_regen: float = 0.0
+    income_mask: int = 0
+
+
+@dataclass(slots=True)
 class Empire:
     """Complete state of a player's empire.
 
@@ -51,6 +97,13 @@ class Empire:
         artifacts: Collected artifact IIDs.
         bosses: Boss critters {iid: Critter}.
         max_life: Maximum life points.
+        tick_coefficients: Cached per-tick rates derived from effects
+            (None = stale, rebuilt on next tick). Not persisted.
+        completed: IIDs of completed buildings and knowledge. Seeded from
+            ``buildings``/``knowledge`` on construction and kept in sync via
+            :meth:`sync_completed` wherever remaining effort is written.
+        citizen_total: Sum of ``citizens`` over all roles. Seeded on
+            construction and updated by the EmpireService citizen methods.
     """
 
     uid: int
@@ -81,8 +134,33 @@ class Empire:
     max_life: float = 10.0
     ruler: Ruler = field(default_factory=Ruler)
     is_bot: bool = False
+    tick_coefficients: TickCoefficients | None = field(default=None, repr=False, compare=False)
+    completed: set[str] = field(init=False, repr=False, compare=False)
+    citizen_total: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.rebuild_completed()
+        self.citizen_total = sum(self.citizens.values())
+
     # -- Helpers ---------------------------------------------------------
 
+    def rebuild_completed(self) -> None:
+        """Recompute the completed set from scratch."""
+        done = {iid for iid, remaining in self.buildings.items() if remaining <= 0}
+        done.update(iid for iid, remaining in self.knowledge.items() if remaining <= 0)
+        self.completed = done
+
+    def sync_completed(self, iid: str) -> None:
+        """Update the completed set after the remaining effort of iid changed."""
+        if self.buildings.get(iid, 1.0) <= 0 or self.knowledge.get(iid, 1.0) <= 0:
+            self.completed.add(iid)
+        else:
+            self.completed.discard(iid)
+
     def get_effect(self, key: str, default: float = 0.0) -> float:
-        """Look up an effect value with a default."""
+        """Look up an effect value with a default.
+
+        Convenience for handlers; the per-tick code in EmpireService reads
+        ``effects.get`` (or the cached TickCoefficients) directly.
+        """
         return self.effects.get(key, default)
@@ -21,7 +21,7 @@ class ItemType(Enum):
     WONDER = "wonder"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ItemDetails:
     """Complete definition of a game item.
 
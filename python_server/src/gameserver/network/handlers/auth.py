@@ -200,7 +200,7 @@ def _build_empire_summary(empire: Any, uid: int) -> dict[str, Any]:
     purchased_tile_count = sum(1 for tile_type in hex_map.values() if tile_type != 'void')
     next_tile_price = svc.empire_service.tile_price_for(empire, purchased_tile_count + 1)
 
-    next_citizen_price = svc.empire_service.citizen_price_for(empire, sum(empire.citizens.values()) + 1)
+    next_citizen_price = svc.empire_service.citizen_price_for(empire, empire.citizen_total + 1)
 
     # Count armies
     army_count = len(empire.armies)
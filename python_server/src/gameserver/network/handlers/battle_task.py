@@ -706,8 +706,10 @@ def _compute_and_apply_loot(battle: "BattleState", svc: Any) -> dict[str, Any]:
                     continue
                 w_remaining = w_emp.knowledge.get(chosen_iid, effort)
                 w_emp.knowledge[chosen_iid] = max(0.0, w_remaining - per_winner_gain)
+                w_emp.sync_completed(chosen_iid)
 
         defender.knowledge[chosen_iid] = min(effort, current_remaining + total_gain)
+        defender.sync_completed(chosen_iid)
         loot["knowledge"] = {
             "iid": chosen_iid,
             "name": item.name if item else chosen_iid,
@@ -722,14 +724,7 @@ def _compute_and_apply_loot(battle: "BattleState", svc: Any) -> dict[str, Any]:
         if defender.research_queue is not None:
             upgrades = svc.upgrade_provider
             if upgrades is not None:
-                completed: set[str] = set()
-                for k, v in defender.buildings.items():
-                    if v <= 0:
-                        completed.add(k)
-                for k, v in defender.knowledge.items():
-                    if v <= 0:
-                        completed.add(k)
-                completed.update(defender.artifacts)
+                completed = defender.completed.union(defender.artifacts)
                 if not upgrades.check_requirements(defender.research_queue, completed):
                     log.info(
                         "[LOOT] Pausing research %s for uid=%d: requirements no longer met after knowledge steal",
@@ -90,14 +90,7 @@ async def handle_item_request(
         }
 
     # Completed items = buildings done + knowledge done + artifacts owned
-    completed: set[str] = set()
-    for iid, remaining in empire.buildings.items():
-        if remaining <= 0:
-            completed.add(iid)
-    for iid, remaining in empire.knowledge.items():
-        if remaining <= 0:
-            completed.add(iid)
-    completed.update(empire.artifacts)
+    completed = empire.completed.union(empire.artifacts)
 
     from gameserver.models.items import ItemType
     up = svc.upgrade_provider
@@ -505,7 +498,7 @@ async def handle_map_save_request(
     empire = svc.empire_service.get(target_uid)
 
     if empire is None:
-        log.warning(f"Map save failed: No empire found for uid {target_uid}")
+        log.warning("Map save failed: No empire found for uid %s", target_uid)
         return {
             "type": "map_save_response",
             "success": False,
@@ -595,7 +588,7 @@ async def handle_map_save_request(
         from gameserver.models.items import ItemType as _ItemType
         structure_iids_check = {
             item.iid
-            for item in svc.upgrade_provider.get_by_type(_ItemType.STRUCTURE)
+            for item in svc.upgrade_provider.iter_by_type(_ItemType.STRUCTURE)
         }
         for tile_key, tile_val in tiles.items():
             tile_type = _tile_type(tile_val)
@@ -612,7 +605,7 @@ async def handle_map_save_request(
     from gameserver.models.items import ItemType as _ItemType
     structure_iids = {
         item.iid
-        for item in svc.upgrade_provider.get_by_type(_ItemType.STRUCTURE)
+        for item in svc.upgrade_provider.iter_by_type(_ItemType.STRUCTURE)
     }
     old_tiles = empire.hex_map or {}
     total_gold_cost = 0.0
@@ -681,7 +674,7 @@ async def handle_map_save_request(
     tile_count = len(tiles)
     empire.hex_map = tiles
     svc.empire_service.invalidate_tile_index()
-    log.info(f"Map saved for empire {empire.name} (uid={target_uid}): {tile_count} tiles")
+    log.info("Map saved for empire %s (uid=%s): %d tiles", empire.name, target_uid, tile_count)
 
     # ── Sync structures into active battle (if one is running) ──────
     battle = _active_battles.get(target_uid)
@@ -817,7 +810,8 @@ async def handle_buy_tile_request(
     empire.hex_map = hex_map
     svc.empire_service.invalidate_tile_index()
 
-    log.info(f"Tile {tile_key} purchased by empire {empire.name} (uid={target_uid}) for {tile_price:.1f} gold")
+    log.info("Tile %s purchased by empire %s (uid=%s) for %.1f gold",
+             tile_key, empire.name, target_uid, tile_price)
 
     return {
         "type": "buy_tile_response",
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import html
 import logging
+import sys
 from typing import Any, Optional
 
 from gameserver.models.messages import GameMessage
@@ -64,13 +65,7 @@ async def handle_military_request(
         })
 
     # Get available critters based on completed research AND buildings
-    completed: set[str] = set()
-    for iid, remaining in empire.buildings.items():
-        if remaining <= 0:
-            completed.add(iid)
-    for iid, remaining in empire.knowledge.items():
-        if remaining <= 0:
-            completed.add(iid)
+    completed = empire.completed
 
     _item_era_index = svc.empire_service._item_era_index
 
@@ -96,7 +91,7 @@ async def handle_military_request(
     from gameserver.models.items import ItemType as _ItemType2
     critter_sprites = {
         c.iid: {"sprite": c.sprite, "animation": c.animation}
-        for c in svc.upgrade_provider.get_by_type(_ItemType2.CRITTER)
+        for c in svc.upgrade_provider.iter_by_type(_ItemType2.CRITTER)
     } if svc.upgrade_provider else {}
 
     # Ongoing attacks
@@ -814,7 +809,7 @@ async def handle_change_wave(
                             "success": False,
                             "error": f"Boss {critter_iid} is already assigned to another wave in this army",
                         }
-        wave.iid = critter_iid
+        wave.iid = sys.intern(critter_iid)
         log.info("change_wave: updated wave %d critter type to %s", wave_number, critter_iid)
 
     # Update slots if provided
@@ -889,7 +884,7 @@ async def handle_set_ruler_wave(
             for w in a.waves:
                 if w.iid == ruler_iid and not (a.aid == aid and w.wave_id == wave.wave_id):
                     w.iid = "SLAVE"
-        wave.iid = ruler_iid
+        wave.iid = sys.intern(ruler_iid)
     else:
         # Remove: restore to SLAVE (default critter)
         wave.iid = "SLAVE"
@@ -987,7 +982,8 @@ async def handle_buy_wave_request(
     # Add to army
     army.waves.append(new_wave)
 
-    log.info(f"Wave purchased for army {aid} by empire {empire.name} (uid={target_uid}) for {wave_price:.1f} gold")
+    log.info("Wave purchased for army %s by empire %s (uid=%s) for %.1f gold",
+             aid, empire.name, target_uid, wave_price)
 
     return {
         "type": "buy_wave_response",
@@ -1070,7 +1066,9 @@ async def handle_buy_critter_slot_request(
     old_slots = wave.slots
     wave.slots += 1
 
-    log.info(f"Critter slot purchased for army {aid} wave {wave_number} by empire {empire.name} (uid={target_uid}) for {slot_price:.1f} gold (slots: {old_slots} → {wave.slots})")
+    log.info("Critter slot purchased for army %s wave %s by empire %s (uid=%s) "
+             "for %.1f gold (slots: %s → %s)",
+             aid, wave_number, empire.name, target_uid, slot_price, old_slots, wave.slots)
 
     return {
         "type": "buy_critter_slot_response",
@@ -1125,7 +1123,8 @@ async def handle_buy_wave_era_request(
     wave.max_era += 1
 
     next_price = svc.empire_service.wave_era_price_for(empire, wave.max_era + 1) if wave.max_era < MAX_ERA_INDEX else None
-    log.info(f"Wave era upgraded for army {aid} wave {wave_number} by uid={target_uid}: era {old_era} → {wave.max_era} for {era_price:.1f} gold")
+    log.info("Wave era upgraded for army %s wave %s by uid=%s: era %s → %s for %.1f gold",
+             aid, wave_number, target_uid, old_era, wave.max_era, era_price)
 
     return {
         "type": "buy_wave_era_response",
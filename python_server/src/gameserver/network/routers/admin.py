@@ -351,6 +351,7 @@ def make_router(services: "Services") -> APIRouter:
         updated = await services.database.rename_empire(uid, name)
         if updated and services.empire_service is not None and uid in services.empire_service.all_empires:
             services.empire_service.all_empires[uid].name = name
+            services.empire_service.invalidate_name_index()
         return {"ok": updated}
 
     @router.get("/api/admin/catalog")
@@ -174,10 +174,12 @@ def make_router(services: "Services", limiter: Limiter) -> APIRouter:
             return {"success": False, "error": "Name must be at least 3 characters"}
         if len(name) > 40:
             return {"success": False, "error": "Name too long (max 40 characters)"}
-        empire = services.empire_service.all_empires.get(uid) if services.empire_service else None
-        if empire is None:
+        empire_svc = services.empire_service
+        empire = empire_svc.all_empires.get(uid) if empire_svc else None
+        if empire_svc is None or empire is None:
             return {"success": False, "error": "Empire not found"}
         empire.name = name
+        empire_svc.invalidate_name_index()
         log.info("Empire renamed: uid=%d new_name=%r", uid, name)
         return {"success": True}
 
@@ -527,9 +527,10 @@ class Database:
 
     async def migrate_messages_from_yaml(self, yaml_path: str) -> int:
         """Import messages from the old YAML file. Returns number of messages imported."""
+        import asyncio
         import base64
         from pathlib import Path
-        import yaml as _yaml
+        from gameserver.loaders.yaml_loader import safe_load
 
         path = Path(yaml_path)
         if not path.exists():
@@ -544,7 +545,8 @@ class Database:
             return 0
 
         try:
-            data = _yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+            text = await asyncio.to_thread(path.read_text, encoding="utf-8")
+            data = await asyncio.to_thread(safe_load, text) or {}
             messages = data.get("messages", []) or []
         except Exception:
             log.exception("MessageStore: failed to read YAML for migration")
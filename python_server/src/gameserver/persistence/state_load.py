@@ -7,13 +7,13 @@ from a previously saved YAML state file.
 from __future__ import annotations
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
-
+from gameserver.loaders.yaml_loader import safe_load
 from gameserver.models.army import Army, CritterWave, SpyArmy
 from gameserver.models.attack import Attack, AttackPhase
 from gameserver.models.battle import BattleState
@@ -82,9 +82,9 @@ async def load_state(path: str = DEFAULT_STATE_PATH) -> Optional[RestoredState]:
         return None
 
     try:
-        raw = yaml.safe_load(state_file.read_text(encoding="utf-8"))
+        raw = safe_load(state_file.read_text(encoding="utf-8"))
     except Exception:
-        # yaml.safe_load raises YAMLError, but also OSError on read failure — catch both
+        # safe_load raises YAMLError, but also OSError on read failure — catch both
         log.exception("Failed to parse state file %s", path)
         return None
 
@@ -196,9 +196,9 @@ def _deserialize_empire(d: dict[str, Any]) -> Empire:
         uid=d["uid"],
         name=d.get("name", ""),
         resources=dict(d.get("resources", {"gold": 0.0, "culture": 0.0, "life": 10.0})),
-        buildings=dict(d.get("buildings", {})),
+        buildings={sys.intern(iid): v for iid, v in d.get("buildings", {}).items()},
         build_queue=d.get("build_queue"),
-        knowledge=dict(d.get("knowledge", {})),
+        knowledge={sys.intern(iid): v for iid, v in d.get("knowledge", {}).items()},
         research_queue=d.get("research_queue"),
         citizens=dict(d.get("citizens", {"merchant": 0, "scientist": 0, "artist": 0})),
         effects=dict(d.get("effects", {})),
@@ -232,7 +232,7 @@ def _deserialize_ruler(d: dict[str, Any]) -> Ruler:
 def _deserialize_structure(d: dict[str, Any]) -> Structure:
     return Structure(
         sid=d["sid"],
-        iid=d["iid"],
+        iid=sys.intern(d["iid"]),
         position=_to_hex(d["position"]),
         damage=d["damage"],
         range=d["range"],
@@ -249,7 +249,7 @@ def _deserialize_structure(d: dict[str, Any]) -> Structure:
 def _deserialize_critter(d: dict[str, Any]) -> Critter:
     return Critter(
         cid=d["cid"],
-        iid=d["iid"],
+        iid=sys.intern(d["iid"]),
         health=d["health"],
         max_health=d["max_health"],
         speed=d["speed"],
@@ -279,7 +279,7 @@ def _deserialize_critter_wave(d: dict[str, Any]) -> CritterWave:
         num_spawned = 0
     return CritterWave(
         wave_id=d["wave_id"],
-        iid=d.get("iid", "SLAVE"),
+        iid=sys.intern(d.get("iid", "SLAVE")),
         slots=slots,
         max_era=d.get("max_era", 0),
         num_critters_spawned=num_spawned,
@@ -7,13 +7,21 @@ implemented are marked with TODO comments in the serializer.
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
 import time
+import weakref
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper  # type: ignore[assignment]
+
 from gameserver.engine.global_state import (
     get_end_criterion_activated,
     get_end_criterion_empire_uid,
@@ -39,6 +47,16 @@ log = logging.getLogger(__name__)
 # Default path for the state file (relative to working directory)
 DEFAULT_STATE_PATH = "state.yaml"
 
+# Saves dump in a worker thread, so two of them can be in flight at once.
+# Writes go through a per-event-loop lock; each save carries a sequence
+# number taken when its snapshot was built, and the newest landed one per
+# file is kept.
+_save_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+_save_seq = itertools.count()
+_landed_seq: dict[str, int] = {}
+
 
 # ===================================================================
 # Public API
@@ -59,6 +77,42 @@ async def save_state(
         battles: Running battles (may be empty if BattleService not yet implemented).
         path: Output file path.
     """
+    seq, state = _snapshot(empires, attacks, battles)
+    async with state_file_lock():
+        await _write_snapshot(seq, state, Path(path))
+
+
+def state_file_lock() -> asyncio.Lock:
+    """Return the state-file lock for the running event loop.
+
+    Hold it to keep the state file stable across a save and a read of the
+    file, and call ``_save_state_locked`` inside it — the lock is not
+    re-entrant, so ``save_state`` would deadlock there.
+    """
+    loop = asyncio.get_running_loop()
+    lock = _save_locks.get(loop)
+    if lock is None:
+        lock = _save_locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def _save_state_locked(
+    empires: dict[int, Empire],
+    attacks: list[Attack] | None = None,
+    battles: list[BattleState] | None = None,
+    path: str = DEFAULT_STATE_PATH,
+) -> None:
+    """``save_state`` for callers that already hold ``state_file_lock()``."""
+    seq, state = _snapshot(empires, attacks, battles)
+    await _write_snapshot(seq, state, Path(path))
+
+
+def _snapshot(
+    empires: dict[int, Empire],
+    attacks: list[Attack] | None,
+    battles: list[BattleState] | None,
+) -> tuple[int, dict[str, Any]]:
+    """Build the serialized state and tag it with the next save sequence number."""
     state: dict[str, Any] = {
         "meta": _serialize_meta(),
         "global": _serialize_global(),
@@ -66,10 +120,28 @@ async def save_state(
         "attacks": [_serialize_attack(a) for a in (attacks or [])],
         "battles": [_serialize_battle(b) for b in (battles or [])],
     }
+    return next(_save_seq), state
+
+
+async def _write_snapshot(seq: int, state: dict[str, Any], out: Path) -> None:
+    """Write a snapshot unless a newer one already landed. Caller holds the lock."""
+    key = str(out.resolve())
+    if seq < _landed_seq.get(key, -1):
+        log.debug("Skipping stale game state save #%d to %s", seq, out)
+        return
+    # The snapshot is built on the event loop; dumping and writing it is
+    # the slow part and runs in a worker thread.
+    await asyncio.to_thread(_write_state, state, out)
+    _landed_seq[key] = seq
+    log.debug("Game state saved to %s (%d empires, %d attacks, %d battles)",
+              out, len(state["empires"]), len(state["attacks"]), len(state["battles"]))
 
-    out = Path(path)
+
+def _write_state(state: dict[str, Any], out: Path) -> None:
+    """Dump a serialized state snapshot to out, atomically where possible."""
     tmp = out.with_suffix(".yaml.tmp")
-    content = yaml.dump(state, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    content = yaml.dump(state, Dumper=SafeDumper, default_flow_style=False,
+                        allow_unicode=True, sort_keys=False)
     try:
         tmp.write_text(content, encoding="utf-8")
         tmp.replace(out)
@@ -77,16 +149,11 @@ async def save_state(
         # bind-mounted single files don't support atomic rename — write in place
         out.write_text(content, encoding="utf-8")
     except Exception:
-        # Unexpected error (e.g. yaml serialization failure) — log, clean up tmp, re-raise
-        log.exception("Failed to save game state to %s", path)
-        if tmp.exists():
-            tmp.unlink(missing_ok=True)
+        # Unexpected error — log, clean up tmp, re-raise
+        log.exception("Failed to save game state to %s", out)
         raise
-    else:
-        if tmp.exists():
-            tmp.unlink(missing_ok=True)
-    log.debug("Game state saved to %s (%d empires, %d attacks, %d battles)",
-              path, len(empires), len(attacks or []), len(battles or []))
+    finally:
+        tmp.unlink(missing_ok=True)
 
 
 # ===================================================================
@@ -273,10 +340,10 @@ def _serialize_editor_hex_map(hex_map: dict[str, Any]) -> list[dict[str, Any]]:
                 })
             except (ValueError, AttributeError, TypeError):
                 # Skip invalid keys (log but don't fail)
-                log.debug(f"Skipping invalid hex_map key: {key}")
+                log.debug("Skipping invalid hex_map key: %s", key)
                 continue
     except Exception as e:
-        log.warning(f"Error serializing editor_hex_map: {e}")
+        log.warning("Error serializing editor_hex_map: %s", e)
         return []
     
     return result
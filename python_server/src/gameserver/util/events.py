@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Callable, TypeVar, Type
+from typing import Any, Callable, Iterable, TypeVar, Type
 
 T = TypeVar("T")
 
@@ -137,6 +137,22 @@ class EventBus:
         for handler in self._handlers.get(type(event), []):
             handler(event)
 
+    def emit_many(self, events: Iterable[object]) -> None:
+        """Emit a batch of events in order.
+
+        Handlers are looked up once per event type for the whole batch
+        rather than once per event.
+        """
+        lookup = self._handlers.get
+        by_type: dict[type, list[Callable[[Any], None]]] = {}
+        for event in events:
+            event_type = type(event)
+            handlers = by_type.get(event_type)
+            if handlers is None:
+                handlers = by_type[event_type] = lookup(event_type, [])
+            for handler in handlers:
+                handler(event)
+
     def clear(self) -> None:
         """Remove all handlers."""
         self._handlers.clear()
@@ -19,7 +19,7 @@ async def send_push(subscription: dict[str, Any], title: str, body: str) -> bool
     from pywebpush import webpush, WebPushException  # type: ignore[import-untyped,import-not-found]
     data = json.dumps({"title": title, "body": body})
     try:
-        await asyncio.get_event_loop().run_in_executor(
+        await asyncio.get_running_loop().run_in_executor(
             None,
             lambda: webpush(
                 subscription_info=subscription,
@@ -174,3 +174,39 @@ class TestBuildItemQueue:
         assert err is None
         assert empire.buildings["INIT"] == 0.0
         assert empire.build_queue is None  # 0-effort doesn't occupy queue
+
+
+class TestCompletedSet:
+    """The empire's completed set is maintained incrementally."""
+
+    def setup_method(self):
+        self.svc = _make_service()
+
+    def test_seeded_from_constructor(self):
+        empire = _make_empire(knowledge={"HUNTING": 0.0, "CRAFTSMANSHIP": 5.0})
+        assert empire.completed == {"INIT", "HUNTING"}
+
+    def test_completion_adds_to_set(self):
+        empire = _make_empire()
+        self.svc.build_item(empire, "FIRE_PLACE")
+        assert "FIRE_PLACE" not in empire.completed
+        self.svc._progress_buildings(empire, dt=1000.0)
+        assert "FIRE_PLACE" in empire.completed
+        assert self.svc.build_item(empire, "HUNTING") is None
+
+    def test_sync_completed_discards_reopened_item(self):
+        empire = _make_empire(knowledge={"HUNTING": 0.0})
+        empire.knowledge["HUNTING"] = 5.0  # e.g. knowledge stolen back
+        empire.sync_completed("HUNTING")
+        assert "HUNTING" not in empire.completed
+
+    def test_current_era_follows_completed_set(self):
+        svc = EmpireService(
+            self.svc._upgrades, EventBus(),
+            knowledge_era_groups={"stone": ["HUNTING"], "bronze": ["CRAFTSMANSHIP"]},
+        )
+        empire = _make_empire(knowledge={"HUNTING": 0.0, "CRAFTSMANSHIP": 0.0})
+        assert svc.get_current_era(empire) == "bronze"
+        empire.knowledge["CRAFTSMANSHIP"] = 5.0
+        empire.sync_completed("CRAFTSMANSHIP")
+        assert svc.get_current_era(empire) == "stone"
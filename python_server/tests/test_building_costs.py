@@ -196,6 +196,7 @@ class TestRequirementsAndCosts:
         """Requirements should be validated before deducting costs."""
         # Remove BASE_CAMP prerequisite to make FIRE_PLACE unavailable
         empire_with_gold.buildings.clear()
+        empire_with_gold.rebuild_completed()
         initial_gold = empire_with_gold.resources["gold"]
         
         result = service.build_item(empire_with_gold, "FIRE_PLACE")
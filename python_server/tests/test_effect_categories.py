@@ -237,6 +237,20 @@ class TestBuildSpeedModifier:
 
         assert e.buildings["FORT"] == pytest.approx(9.0)
 
+    def test_cached_speed_refreshed_after_recalculate(self):
+        svc = _svc()
+        svc._upgrades.get_effects.return_value = {fx.BUILD_SPEED_MODIFIER: 1.0}
+        e = _empire()
+        e.buildings["FORT"] = 10.0
+        e.build_queue = "FORT"
+
+        svc._progress_buildings(e, dt=1.0)  # caches base speed 1.0
+        e.buildings["WORKSHOP"] = 0.0
+        svc.recalculate_effects(e)  # +100% build speed, cache marked stale
+        svc._progress_buildings(e, dt=1.0)
+
+        assert e.buildings["FORT"] == pytest.approx(7.0)
+
 
 class TestBuildSpeedOffset:
     """BUILD_SPEED_OFFSET is added to the base speed before the modifier."""
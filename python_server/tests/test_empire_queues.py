@@ -280,6 +280,64 @@ class TestStepIntegration:
         assert empire.buildings["old"] == 2.0
         assert empire.knowledge["old_k"] == 2.0
 
+    def test_register_seeds_missing_resource_keys(self, service: EmpireService):
+        """Partial resource dicts (e.g. old saves) get every key step() writes."""
+        empire = Empire(uid=2, name="Legacy", resources={"gold": 7.0})
+        service.register(empire)
+
+        service.step(empire, dt=1.0)
+
+        assert empire.resources["gold"] >= 7.0
+        assert {"gold", "culture", "life"} <= empire.resources.keys()
+
+    def test_idle_empire_skips_income(self, service: EmpireService, empire: Empire):
+        """Without base income or offsets the mask is 0 and resources stay put."""
+        service._base_gold = 0.0
+        service._base_culture = 0.0
+        empire.citizens["merchant"] = 5
+        before = dict(empire.resources)
+
+        service.step(empire, dt=10.0)
+
+        assert empire.tick_coefficients.income_mask == 0
+        assert empire.resources == before
+
+    def test_income_resumes_after_recalculate(self, service: EmpireService, empire: Empire):
+        """A new gold_offset effect re-activates the empire on the next tick."""
+        service._base_gold = 0.0
+        service._base_culture = 0.0
+        service.step(empire, dt=1.0)
+        empire.buildings["market"] = 0.0
+        service._upgrades.get_effects.side_effect = lambda iid: {"gold_offset": 2.0}
+        service.recalculate_effects(empire)
+
+        service.step(empire, dt=1.0)
+
+        assert empire.resources["gold"] == pytest.approx(2.0)
+
+    def test_step_all_after_unregister_and_reregister(self, service: EmpireService):
+        """step_all advances every registered empire exactly once."""
+        empires = {uid: Empire(uid=uid, name=f"E{uid}") for uid in (1, 2, 3)}
+        for emp in empires.values():
+            service.register(emp)
+        service.unregister(1)
+        replacement = Empire(uid=3, name="E3b")
+        service.register(replacement)
+        for emp in (empires[2], replacement):
+            emp.buildings["hut"] = 10.0
+            emp.build_queue = "hut"
+
+        service.step_all(dt=1.0)
+
+        assert empires[2].buildings["hut"] == 9.0
+        assert replacement.buildings["hut"] == 9.0
+        assert "hut" not in empires[1].buildings
+
+    def test_step_all_zero_dt_is_noop(self, service: EmpireService, empire: Empire):
+        service.register(empire)
+        service.step_all(dt=0.0)
+        assert empire.tick_coefficients is None  # step() never ran
+
 
 # ── Effects recalculated on completion ────────────────────────────────
 
@@ -429,6 +429,103 @@ class TestGameLoop:
         assert gl.tick_count >= 1
         assert not gl.is_running
 
+    async def test_run_sleeps_until_next_deadline(self):
+        """Time spent in _step is subtracted from the following sleep."""
+        gl, _, _ = _make_game_loop()
+        clock = [100.0]
+        sleeps: list[float] = []
+        steps: list[float] = []
+
+        def slow_step(dt):
+            steps.append(dt)
+            clock[0] += 0.3
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+            if len(sleeps) == 3:
+                gl.stop()
+
+        gl._step = slow_step
+        with patch("gameserver.engine.game_loop.time.monotonic", side_effect=lambda: clock[0]), \
+             patch("gameserver.engine.game_loop.asyncio.sleep", side_effect=fake_sleep):
+            await gl.run()
+        # First tick has no elapsed time to consume, so it only sleeps
+        assert sleeps == pytest.approx([1.0, 0.7, 0.7])
+        assert steps == [1.0, 1.0]
+        assert gl.last_tick_dt == pytest.approx(1.0)
+
+    async def test_run_folds_large_backlog_into_one_step(self):
+        """After a long stall the fixed steps are capped and the rest is folded."""
+        gl, _, _ = _make_game_loop()
+        clock = [0.0]
+        steps: list[float] = []
+
+        async def fake_sleep(delay):
+            clock[0] += delay
+            if len(steps) == 0:
+                clock[0] += 9.0  # stall: wake 9 intervals late
+            else:
+                gl.stop()
+
+        gl._step = steps.append
+        with patch("gameserver.engine.game_loop.time.monotonic", side_effect=lambda: clock[0]), \
+             patch("gameserver.engine.game_loop.asyncio.sleep", side_effect=fake_sleep):
+            await gl.run()
+        assert steps == [1.0] * GameLoop.MAX_TICK_BACKLOG + [5.0]
+
+    async def test_avg_tick_duration_is_moving_average(self):
+        """The first step seeds the average, later steps move it by alpha."""
+        gl, _, _ = _make_game_loop()
+        clock = [0.0]
+        durations = iter([0.010, 0.020])
+        sleeps: list[float] = []
+
+        def timed_step(dt):
+            clock[0] += next(durations, 0.0)
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            clock[0] += delay
+            if len(sleeps) == 3:
+                gl.stop()
+
+        gl._step = timed_step
+        with patch("gameserver.engine.game_loop.time.monotonic", side_effect=lambda: clock[0]), \
+             patch("gameserver.engine.game_loop.asyncio.sleep", side_effect=fake_sleep):
+            await gl.run()
+        # The first wakeup has nothing due and is not counted; steps take 10 and 20 ms
+        alpha = GameLoop.TICK_DURATION_ALPHA
+        expected = 10.0 + alpha * (20.0 - 10.0)
+        assert gl.tick_count == 2
+        assert gl.last_tick_duration_ms == pytest.approx(20.0)
+        assert gl.avg_tick_duration_ms == pytest.approx(expected)
+
+    async def test_tick_duration_is_per_step_on_catch_up(self):
+        """A wakeup that runs several steps counts each and averages their time."""
+        gl, _, _ = _make_game_loop()
+        clock = [0.0]
+        wakeups: list[float] = []
+
+        def timed_step(dt):
+            clock[0] += 0.010
+
+        async def fake_sleep(delay):
+            wakeups.append(delay)
+            clock[0] += delay
+            if len(wakeups) == 1:
+                clock[0] += 2.0  # wake two intervals late: three steps due
+            else:
+                gl.stop()
+
+        gl._step = timed_step
+        with patch("gameserver.engine.game_loop.time.monotonic", side_effect=lambda: clock[0]), \
+             patch("gameserver.engine.game_loop.asyncio.sleep", side_effect=fake_sleep):
+            await gl.run()
+        assert gl.tick_count == 3
+        assert gl.last_tick_duration_ms == pytest.approx(10.0)
+        assert gl.avg_tick_duration_ms == pytest.approx(10.0)
+
     async def test_save_state_does_not_raise(self):
         gl, _, attack_svc = _make_game_loop()
         attack_svc.get_all_attacks.return_value = []
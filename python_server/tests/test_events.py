@@ -41,3 +41,15 @@ class TestEventBus:
         bus.clear()
         # Should not raise
         bus.emit(CritterDied(critter_id=1))
+
+    def test_emit_many_preserves_order_across_types(self):
+        bus = EventBus()
+        received = []
+        bus.on(CritterDied, lambda e: received.append(("died", e.critter_id)))
+        bus.on(CritterFinished, lambda e: received.append(("finished", e.critter_id)))
+        bus.emit_many([
+            CritterDied(critter_id=1),
+            CritterFinished(critter_id=2, with_transfer=False),
+            CritterDied(critter_id=3),
+        ])
+        assert received == [("died", 1), ("finished", 2), ("died", 3)]
@@ -324,3 +324,54 @@ class TestFindPath:
         result = find_path_from_spawn_to_castle(tiles)
         assert result is not None
         assert validate_path(result)
+
+    def test_unreachable_spawn_falls_back_to_next_spawn(self):
+        tiles = self._tiles({
+            (-3, 0): "spawnpoint",   # walled in by void
+            (-2, 0): "void",
+            (0, 0): "spawnpoint",
+            (1, 0): "empty",
+            (2, 0): "castle",
+        })
+        result = find_path_from_spawn_to_castle(tiles)
+        assert result == _hpath((0, 0), (1, 0), (2, 0))
+
+    def test_dict_tiles_are_not_walkable(self):
+        # Raw empire maps mix plain strings with {'type': ..., 'select': ...} dicts
+        tiles = self._tiles({
+            (0, 0): "spawnpoint",
+            (1, 0): "empty",
+            (2, 0): "castle",
+        })
+        tiles["1,-1"] = {"type": "tower_basic", "select": "first"}
+        result = find_path_from_spawn_to_castle(tiles)
+        assert result == _hpath((0, 0), (1, 0), (2, 0))
+
+    def test_repeated_lookup_returns_fresh_list(self):
+        tiles = self._tiles({
+            (0, 0): "spawnpoint",
+            (1, 0): "path",
+            (2, 0): "castle",
+        })
+        first = find_path_from_spawn_to_castle(tiles)
+        first.append(HexCoord(9, 9))
+        second = find_path_from_spawn_to_castle(dict(tiles))
+        assert second == _hpath((0, 0), (1, 0), (2, 0))
+        assert second is not first
+
+    def test_search_errors_are_not_retried_uncached(self, monkeypatch):
+        # Only unhashable tile values bypass the cache; a TypeError raised by
+        # the search itself must surface instead of triggering a second run.
+        from gameserver.engine import hex_pathfinding
+
+        calls = []
+
+        def broken_search(tiles):
+            calls.append(tiles)
+            raise TypeError("bug in search")
+
+        monkeypatch.setattr(hex_pathfinding, "_search_path", broken_search)
+        tiles = self._tiles({(0, 0): "spawnpoint", (7, 0): "castle"})
+        with pytest.raises(TypeError, match="bug in search"):
+            find_path_from_spawn_to_castle(tiles)
+        assert len(calls) == 1
@@ -1,5 +1,6 @@
 """Tests for item_loader — ensures config files load correctly."""
 
+import sys
 from pathlib import Path
 
 import pytest
@@ -71,6 +72,15 @@ class TestLoadItemsFromConfigDir:
         for k in knowledge:
             assert k.effort > 0, f"Knowledge {k.iid} has no effort value"
 
+    def test_ids_and_effect_keys_interned(self):
+        items = load_items(CONFIG_DIR)
+        for item in items:
+            assert item.iid is sys.intern(item.iid)
+            for key in item.effects:
+                assert key is sys.intern(key)
+            for req in item.requirements:
+                assert req is sys.intern(req)
+
 
 class TestStructureSelectAttribute:
     """Verify the 'select' targeting strategy field on structure items."""
@@ -170,3 +180,34 @@ class TestLoadItemsFromDirectory:
         items = load_items(tmp_path)
         assert len(items) == 1
         assert items[0].item_type == ItemType.ARTIFACT
+
+
+class TestUpgradeProviderLookups:
+    """Indexed lookups on UpgradeProvider agree with a plain scan."""
+
+    def test_available_items_match_scan(self):
+        from gameserver.engine.upgrade_provider import UpgradeProvider
+        up = UpgradeProvider()
+        up.load(load_items(CONFIG_DIR))
+        completed = {"BASE_CAMP", "FIRE_PLACE"}
+        for item_type in ItemType:
+            expected = [
+                i for i in up.items.values()
+                if i.item_type == item_type and all(r in completed for r in i.requirements)
+            ]
+            assert up.available_items(item_type, completed) == expected
+            assert up.get_by_type(item_type) == [
+                i for i in up.items.values() if i.item_type == item_type
+            ]
+            assert list(up.iter_by_type(item_type)) == up.get_by_type(item_type)
+
+    def test_replacing_items_refreshes_index(self):
+        from gameserver.engine.upgrade_provider import UpgradeProvider
+        up = UpgradeProvider()
+        up.load(load_items(CONFIG_DIR))
+        assert up.get_by_type(ItemType.BUILDING)
+        tower = ItemDetails(iid="T", name="T", item_type=ItemType.STRUCTURE, requirements=["X"])
+        up.items = {"T": tower}
+        assert up.get_by_type(ItemType.BUILDING) == []
+        assert up.available_items(ItemType.STRUCTURE, {"X"}) == [tower]
+        assert not up.check_requirements("T", set())
@@ -63,6 +63,29 @@ class TestCitizenCostModifier:
         assert err is None  # succeeds at discounted price
 
 
+class TestCitizenTotal:
+    def test_total_tracks_upgrades_and_redistribution(self, service: EmpireService):
+        """citizen_total follows upgrade_citizen and change_citizens."""
+        empire = Empire(uid=2, citizens={"merchant": 1, "scientist": 0, "artist": 0, "free": 2})
+        service.register(empire)
+        assert empire.citizen_total == 3
+        empire.resources["culture"] = 1e12
+        assert service.upgrade_citizen(empire) is None
+        assert empire.citizen_total == 4 == sum(empire.citizens.values())
+        assert service.change_citizens(empire, {"merchant": 4, "scientist": 0, "artist": 0}) is None
+        assert empire.citizen_total == 4
+        err = service.change_citizens(empire, {"merchant": 5, "scientist": 0, "artist": 0})
+        assert err is not None and "expected 4" in err
+
+    def test_change_citizens_rejects_non_int_counts(self, service: EmpireService):
+        """bool and float counts are rejected even though they compare like ints."""
+        empire = Empire(uid=3, citizens={"merchant": 1, "scientist": 0, "artist": 0})
+        for bad in (True, 1.0):
+            err = service.change_citizens(empire, {"merchant": bad, "scientist": 0, "artist": 0})
+            assert err is not None and "non-negative integer" in err
+        assert empire.citizens == {"merchant": 1, "scientist": 0, "artist": 0}
+
+
 # ── tile_cost_modifier ────────────────────────────────────────────────
 
 
@@ -328,3 +351,24 @@ class TestEnemySiegeTimeModifier:
         # 30 * (1 - 0.5) * (1 - 0.5) = 7.5
         duration = attack_service._calculate_siege_duration(1, 2, base_override=30.0)
         assert duration == pytest.approx(7.5)
+
+
+# ── price lookup tables ───────────────────────────────────────────────
+
+
+class TestPriceTables:
+    def test_table_matches_formula(self, service: EmpireService, gc: GameConfig):
+        p = gc.prices.citizen
+        for i in (0, 1, 7, 1023):
+            assert service._citizen_price(i) == float(p.u + (i * p.y) * (i + p.z) ** p.v)
+
+    def test_beyond_table_falls_back_to_formula(self, service: EmpireService, gc: GameConfig):
+        p = gc.prices.tile
+        i = 5000
+        assert service._tile_price(i) == float(p.u + (i * p.y) * (i + p.z) ** p.v)
+
+    def test_config_reload_uses_new_params(self, service: EmpireService):
+        before = service._wave_price(3)
+        service._gc = GameConfig()
+        service._gc.prices.wave.u = 1000.0
+        assert service._wave_price(3) == pytest.approx(before + 1000.0)
@@ -410,6 +410,13 @@ class TestEmpireRenameRouter:
         assert data["success"] is True
         assert svc.empire_service.all_empires[TEST_UID].name == "NewName"
 
+    async def test_rename_updates_name_lookup(self, client, svc):
+        old_name = svc.empire_service.all_empires[TEST_UID].name
+        assert svc.empire_service.find_by_name(old_name) is not None  # builds the index
+        await client.post("/api/empire/rename", json={"name": "Renamed"}, headers=_auth())
+        assert svc.empire_service.find_by_name("renamed").uid == TEST_UID
+        assert svc.empire_service.find_by_name(old_name) is None
+
     async def test_rename_too_short(self, client, svc):
         resp = await client.post(
             "/api/empire/rename",
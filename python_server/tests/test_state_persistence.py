@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import stat
+import time
 from pathlib import Path
 
 import pytest
@@ -16,6 +19,7 @@ from gameserver.models.hex import HexCoord
 from gameserver.models.shot import Shot
 from gameserver.models.structure import Structure
 from gameserver.persistence.state_load import load_state
+from gameserver.persistence import state_save
 from gameserver.persistence.state_save import save_state
 
 
@@ -149,6 +153,17 @@ class TestSaveLoad:
         assert e.resources["life"] == pytest.approx(8.5)
         assert e.max_life == 12.0
 
+    def test_round_trip_emoji_names(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "state.yaml")
+        src = _make_empire(name="Kuckuck 🦉")
+        src.armies[0].name = "Piu Piu 🥝"
+        self._run(save_state({src.uid: src}, path=path))
+        restored = self._run(load_state(path))
+        assert restored is not None
+        e = restored.empires[src.uid]
+        assert e.name == "Kuckuck 🦉"
+        assert e.armies[0].name == "Piu Piu 🥝"
+
     def test_round_trip_buildings_knowledge(self, tmp_path: Path) -> None:
         path = str(tmp_path / "state.yaml")
         src = _make_empire()
@@ -302,6 +317,47 @@ class TestSaveLoad:
         assert not Path(path + ".tmp").exists()
         assert not (tmp_path / "state.yaml.tmp").exists()
         assert Path(path).exists()
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_saved_file_mode_follows_umask(self, tmp_path: Path) -> None:
+        """The state file gets the usual umask-derived mode, not owner-only."""
+        path = tmp_path / "state.yaml"
+        e = _make_empire()
+        old_umask = os.umask(0o022)
+        try:
+            self._run(save_state({e.uid: e}, path=str(path)))
+        finally:
+            os.umask(old_umask)
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    def test_overlapping_saves_newest_wins(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Two saves in flight at once: the later snapshot ends up on disk."""
+        path = str(tmp_path / "state.yaml")
+        write = state_save._write_state
+
+        def slow_write(state: dict, out: Path) -> None:
+            # Hold the older snapshot in the worker thread so the newer one
+            # would finish first without serialization.
+            if state["empires"][0]["name"] == "Old":
+                time.sleep(0.2)
+            write(state, out)
+
+        monkeypatch.setattr(state_save, "_write_state", slow_write)
+
+        async def both() -> None:
+            old = _make_empire(name="Old")
+            new = _make_empire(name="New")
+            await asyncio.gather(
+                save_state({old.uid: old}, path=path),
+                save_state({new.uid: new}, path=path),
+            )
+
+        self._run(both())
+        restored = self._run(load_state(path))
+        assert restored.empires[1].name == "New"
+        assert list(tmp_path.glob("*.tmp")) == []
 
     def test_critter_status_effects(self, tmp_path: Path) -> None:
         """Verify slow/burn effects survive round trip."""
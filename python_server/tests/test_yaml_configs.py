@@ -53,6 +53,27 @@ def test_yaml_parses_without_error(filename: str):
     yaml.safe_load(path.read_text(encoding="utf-8"))  # raises on bad YAML
 
 
+@pytest.mark.parametrize("filename", _YAML_FILES)
+def test_loader_parse_matches_safe_load(filename: str):
+    """The (libyaml-backed) loader parser yields the same data as yaml.safe_load."""
+    from gameserver.loaders.yaml_loader import safe_load
+    text = (_CONFIG / filename).read_text(encoding="utf-8")
+    assert safe_load(text) == yaml.safe_load(text)
+
+
+def test_era_groups_from_items_match_yaml():
+    """Era groups taken from loaded items equal those read from the category files."""
+    from gameserver.loaders.item_loader import load_items
+    from gameserver.main import _era_groups_from_items, _load_era_groups_from_yaml
+    from gameserver.models.items import ItemType
+    by_type = _era_groups_from_items(load_items(_CONFIG))
+    for filename, item_type in (("knowledge.yaml", ItemType.KNOWLEDGE),
+                                ("buildings.yaml", ItemType.BUILDING),
+                                ("structures.yaml", ItemType.STRUCTURE),
+                                ("critters.yaml", ItemType.CRITTER)):
+        assert by_type.get(item_type, {}) == _load_era_groups_from_yaml(_CONFIG / filename)
+
+
 # ---------------------------------------------------------------------------
 # game.yaml
 # ---------------------------------------------------------------------------